@@ -5,7 +5,7 @@ from sqlalchemy import pool
 
 from alembic import context
 from app.models.base import Base
-from app.models import user, organisation, role, permission, language, contacts
+from app.models import user, organisation, role, permission, language, contacts, identity, email_outbox
 
 
 # this is the Alembic Config object, which provides
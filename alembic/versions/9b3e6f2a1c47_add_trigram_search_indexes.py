@@ -0,0 +1,46 @@
+"""Add trigram search indexes
+
+Revision ID: 9b3e6f2a1c47
+Revises: 71365c1ff564
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3e6f2a1c47"
+down_revision: Union[str, None] = "71365c1ff564"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = [
+    ("users", "first_name"),
+    ("users", "last_name"),
+    ("users", "email"),
+    ("roles", "name"),
+    ("roles", "description"),
+    ("permissions", "name"),
+    ("permissions", "description"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table_name, column_name in TRIGRAM_INDEXES:
+        op.create_index(
+            f"ix_{table_name}_{column_name}_trgm",
+            table_name,
+            [column_name],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column_name: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for table_name, column_name in TRIGRAM_INDEXES:
+        op.drop_index(f"ix_{table_name}_{column_name}_trgm", table_name=table_name)
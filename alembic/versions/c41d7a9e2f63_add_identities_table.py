@@ -0,0 +1,104 @@
+"""Add identities table shared by users and organisations
+
+Revision ID: c41d7a9e2f63
+Revises: 9b3e6f2a1c47
+Create Date: 2026-10-18 11:02:17.804113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d7a9e2f63"
+down_revision: Union[str, None] = "9b3e6f2a1c47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+IDENTITY_TRIGGERS_DDL = """
+CREATE OR REPLACE FUNCTION sync_users_identity() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.email IS NOT DISTINCT FROM NEW.email THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.email IS NOT NULL THEN
+        DELETE FROM identities WHERE user_id = OLD.uuid;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.email IS NOT NULL THEN
+        INSERT INTO identities (email, user_id) VALUES (lower(NEW.email), NEW.uuid);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS users_identity ON users;
+CREATE TRIGGER users_identity
+    AFTER INSERT OR UPDATE OF email OR DELETE ON users
+    FOR EACH ROW EXECUTE FUNCTION sync_users_identity();
+
+CREATE OR REPLACE FUNCTION sync_organisations_identity() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.email IS NOT DISTINCT FROM NEW.email THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.email IS NOT NULL THEN
+        DELETE FROM identities WHERE organisation_id = OLD.uuid;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.email IS NOT NULL THEN
+        INSERT INTO identities (email, organisation_id) VALUES (lower(NEW.email), NEW.uuid);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS organisations_identity ON organisations;
+CREATE TRIGGER organisations_identity
+    AFTER INSERT OR UPDATE OF email OR DELETE ON organisations
+    FOR EACH ROW EXECUTE FUNCTION sync_organisations_identity();
+"""
+
+IDENTITY_BACKFILL_SQL = """
+INSERT INTO identities (email, user_id)
+    SELECT lower(email), uuid FROM users WHERE email IS NOT NULL
+    ON CONFLICT DO NOTHING;
+INSERT INTO identities (email, organisation_id)
+    SELECT lower(email), uuid FROM organisations WHERE email IS NOT NULL
+    ON CONFLICT DO NOTHING;
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "identities",
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("organisation_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.CheckConstraint(
+            "num_nonnulls(user_id, organisation_id) = 1",
+            name="ck_identities_single_owner",
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.uuid"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["organisation_id"], ["organisations.uuid"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("email"),
+        sa.UniqueConstraint("user_id"),
+        sa.UniqueConstraint("organisation_id"),
+    )
+    # Existing case-insensitive duplicates keep the user row, matching the
+    # previous users-then-organisations lookup order.
+    op.execute(IDENTITY_BACKFILL_SQL)
+    op.execute(IDENTITY_TRIGGERS_DDL)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS users_identity ON users")
+    op.execute("DROP TRIGGER IF EXISTS organisations_identity ON organisations")
+    op.execute("DROP FUNCTION IF EXISTS sync_users_identity()")
+    op.execute("DROP FUNCTION IF EXISTS sync_organisations_identity()")
+    op.drop_table("identities")
@@ -0,0 +1,91 @@
+# Streaming NDJSON and CSV exports
+import csv
+import io
+from typing import Any, AsyncIterator, Optional, Sequence, Type
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from app.common.enums import ExportFormat
+from app.schemas.base import validate_list
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return to_json(value).decode()
+    return value
+
+
+async def _ndjson_chunks(schema, first, batches, request) -> AsyncIterator[bytes]:
+    try:
+        rows = first
+        while rows is not None:
+            items = validate_list(schema, rows, request)
+            yield b"".join(to_json(item) + b"\n" for item in items)
+            rows = await anext(batches, None)
+    finally:
+        await batches.aclose()
+
+
+async def _csv_chunks(schema, first, batches, request) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(schema.model_fields)
+    try:
+        rows = first
+        while rows is not None:
+            for item in validate_list(schema, rows, request):
+                values = item.model_dump(mode="json").values()
+                writer.writerow(_csv_value(value) for value in values)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = await anext(batches, None)
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+    finally:
+        await batches.aclose()
+
+
+async def export_response(
+    schema: Type[BaseModel],
+    batches: AsyncIterator[Sequence[Any]],
+    export_format: ExportFormat,
+    filename: str,
+    request: Optional[Request] = None,
+) -> StreamingResponse:
+    """
+    Stream ``batches`` of rows to the client as NDJSON or CSV.
+
+    Each batch is converted to ``schema`` and written out as soon as it is
+    fetched, so only one batch is held in memory at a time. The first batch
+    is fetched before the response starts, so query errors still produce a
+    regular error response rather than a truncated 200.
+
+    Args:
+        schema: Response schema for each row; CSV columns follow its fields.
+        batches: Row batches, e.g. from ``BaseRepository.stream``.
+        export_format (ExportFormat): NDJSON or CSV.
+        filename (str): Download name, without extension.
+        request (Optional[Request]): Used to build absolute media URLs.
+    """
+    first = await anext(batches, None)
+    chunks = _csv_chunks if export_format == ExportFormat.CSV else _ndjson_chunks
+    return StreamingResponse(
+        chunks(schema, first, batches, request),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{filename}.{export_format.value}"'
+            )
+        },
+    )
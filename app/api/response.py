@@ -1,10 +1,22 @@
-import json
 from starlette import status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from pydantic_core import to_json
 from typing import Optional, Union, List, Any
 
 
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response encoded straight to bytes by pydantic-core.
+
+    Pydantic models, UUIDs, datetimes, enums and decimals are encoded natively,
+    so callers can pass models as-is instead of converting them to dicts first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
 class APIErrorResponse(BaseModel):
     success: bool = False
     message: str
@@ -21,16 +33,12 @@ class APIResponse:
 
     @staticmethod
     def success(message: str, data: Any = None, status_code: int = status.HTTP_200_OK):
-        if isinstance(data, BaseModel):
-            data = data.dict()  # Convert a single BaseModel instance to a dictionary
-        elif isinstance(data, list):
-            # Convert a list of BaseModel instances to a list of dictionaries
-            data = [item.dict() if isinstance(item, BaseModel) else item for item in data]
-
+        # ``data`` may hold models or lists of models; they are serialized with
+        # the envelope in a single pass.
         response_data = APISuccessResponse(message=message, data=data)
-        return JSONResponse(content=response_data.dict(), status_code=status_code)
+        return FastJSONResponse(content=response_data, status_code=status_code)
 
     @staticmethod
     def error(message: str, status_code: int = 400, details: dict = None):
         response_data = APIErrorResponse(message=message, details=details)
-        return JSONResponse(content=dict(response_data), status_code=status_code)
+        return FastJSONResponse(content=response_data, status_code=status_code)
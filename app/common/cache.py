@@ -0,0 +1,74 @@
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from cachetools import TTLCache
+
+from app.config.settings import PERMISSION_CACHE_MAXSIZE, PERMISSION_CACHE_TTL_SECONDS
+
+CACHE_MISS = object()
+
+
+class PermissionCache:
+    """
+    In-process cache for authorization lookups.
+
+    Holds two maps: user id -> role name and role name -> permission names.
+    Entries are dropped explicitly by the services that change roles or
+    permissions; the TTL only bounds staleness across worker processes,
+    which do not see each other's invalidations.
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self._user_roles = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._role_permissions = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, cache: TTLCache, key):
+        value = cache.get(key, CACHE_MISS)
+        if value is CACHE_MISS:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def get_user_role(self, user_id: str):
+        """Return the cached role name (``None`` for users without a role), or ``CACHE_MISS``."""
+        return self._lookup(self._user_roles, str(user_id))
+
+    def set_user_role(self, user_id: str, role_name: Optional[str]):
+        self._user_roles[str(user_id)] = role_name
+
+    def get_role_permissions(self, role_name: str):
+        """Return the cached permission names of ``role_name``, or ``CACHE_MISS``."""
+        return self._lookup(self._role_permissions, role_name)
+
+    def set_role_permissions(self, role_name: str, permissions: FrozenSet[str]):
+        self._role_permissions[role_name] = permissions
+
+    def invalidate_user(self, user_id: str):
+        self._user_roles.pop(str(user_id), None)
+
+    def invalidate_roles(self, role_names: Optional[Iterable[str]] = None):
+        """Drop the permissions of ``role_names``, or of every role when omitted."""
+        if role_names is None:
+            self._role_permissions.clear()
+            return
+        for role_name in role_names:
+            self._role_permissions.pop(role_name, None)
+
+    def clear(self):
+        self._user_roles.clear()
+        self._role_permissions.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "user_roles": len(self._user_roles),
+            "role_permissions": len(self._role_permissions),
+        }
+
+
+permission_cache = PermissionCache(
+    maxsize=PERMISSION_CACHE_MAXSIZE, ttl=PERMISSION_CACHE_TTL_SECONDS
+)
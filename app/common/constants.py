@@ -1,14 +1,16 @@
 TRAILING_SLASH = "/"
 
+# Paths served outside the API routers; routes themselves opt out of
+# authentication with ``app.core.security.public``.
 UNPROTECTED_ROUTE_PATHS = [
     r"/(docs|profile_pictures/.+)$",
     r"/(openapi.json|favicon.ico)$",
-    r"/api/v1/(login|request-password-reset|reset-password|send-otp-reset-password|verify-otp-reset-password)$",
-    r"/api/v1/registration/(individual|organisation)$",
-    r"/api/v1/token/refresh/?$",
-    r"/api/v1/oauth/callback/?$",
 ]
 
+PUBLIC_PATH_CACHE_SIZE = 4096
+
 UNPROTECTED_MFA_ROUTE_PATHS = [
     *UNPROTECTED_ROUTE_PATHS,
 ]
+
+DEFAULT_CURSOR_PAGE_SIZE = 50
@@ -1,19 +1,19 @@
 import contextvars
 
-# Create a context variable for storing user information
+# Context variable holding the authenticated ``Principal`` of the current request
 _user_context = contextvars.ContextVar("user_context", default=None)
 
 
 class UserContext:
     @staticmethod
-    def set(user_info):
-        """Set user information in the context."""
-        token = _user_context.set(user_info)
+    def set(principal):
+        """Set the authenticated principal in the context."""
+        token = _user_context.set(principal)
         return token
 
     @staticmethod
     def get():
-        """Retrieve the user information from the context."""
+        """Retrieve the authenticated principal from the context."""
         return _user_context.get()
 
     @staticmethod
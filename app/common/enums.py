@@ -50,3 +50,14 @@ oauth_provider_choices = [
     (OAuthProvider.APPLE.value, "Apple"),
     (OAuthProvider.ZOHO.value, "Zoho"),
 ]
+
+
+class EmailStatus(Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    DEAD = "dead"
+
+
+class ExportFormat(Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
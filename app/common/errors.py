@@ -98,6 +98,20 @@ class RoleAssignedToPermissionError(AppError):
         super().__init__(self.message, self.status_code)
 
 
+class InvalidCursorError(AppError):
+    def __init__(self, message="Invalid pagination cursor."):
+        self.message = message
+        self.status_code = status.HTTP_400_BAD_REQUEST  # Bad Request
+        super().__init__(self.message, self.status_code)
+
+
+class ProviderUnavailableError(AppError):
+    def __init__(self, message="Login provider is temporarily unavailable."):
+        self.message = message
+        self.status_code = status.HTTP_503_SERVICE_UNAVAILABLE  # Service Unavailable
+        super().__init__(self.message, self.status_code)
+
+
 
 
 
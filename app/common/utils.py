@@ -1,4 +1,12 @@
+import base64
+import json
+import uuid
 from datetime import datetime
+from typing import Any, List, Optional
+
+from sqlalchemy.dialects.postgresql import Range
+
+from app.common.errors import InvalidCursorError
 
 
 def format_timestamp(
@@ -17,3 +25,97 @@ def format_timestamp(
     if timestamp is None:
         return ""
     return timestamp.strftime(format_string)
+
+
+def parse_datetime(value: Optional[str | datetime]) -> Optional[datetime]:
+    """Parses an ISO 8601 date/datetime string for a timestamp column.
+
+    asyncpg does not coerce strings for timestamp parameters, so values coming
+    from request payloads have to be converted before they reach the database.
+
+    Args:
+        value (Optional[str | datetime]): ISO 8601 string, datetime or None.
+
+    Returns:
+        Optional[datetime]: The parsed datetime, or None for empty values.
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def parse_int_range(value: Optional[str]) -> Optional[Range]:
+    """Parses an inclusive ``"[min,max]"`` string (``max`` may be empty) into a Range.
+
+    Args:
+        value (Optional[str]): Range string such as ``"[1,10]"`` or ``"[100,]"``.
+
+    Returns:
+        Optional[Range]: The equivalent INT4RANGE value, or None for empty values.
+    """
+    if not value:
+        return None
+    min_count, max_count = value.strip("[]").split(",")
+    if max_count == "":
+        return Range(int(min_count), None, bounds="[)")
+    return Range(int(min_count), int(max_count), bounds="[]")
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """Encodes the sort-key values of the last row of a page into an opaque cursor.
+
+    Args:
+        values (List[Any]): Values of the ordering columns, in ordering order.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    serialized = [
+        value.isoformat() if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(serialized, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, python_types: List[type]) -> List[Any]:
+    """Decodes a cursor produced by ``encode_cursor`` back into typed values.
+
+    Args:
+        cursor (str): Cursor string received from the client.
+        python_types (List[type]): Python type of each ordering column.
+
+    Returns:
+        List[Any]: Values converted to the column types.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or does not match the ordering.
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        if not isinstance(values, list) or len(values) != len(python_types):
+            raise ValueError("Cursor does not match the requested ordering")
+        return [
+            _parse_cursor_value(value, python_type)
+            for value, python_type in zip(values, python_types)
+        ]
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError from e
+
+
+def _parse_cursor_value(value: Any, python_type: type) -> Any:
+    if value is None:
+        return None
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    return python_type(value)
+
+
+def escape_like(value: str) -> str:
+    """Escapes ``LIKE`` wildcards so user input is matched literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
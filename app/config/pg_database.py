@@ -1,16 +1,108 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import Pool
 
 from .settings import SQLALCHEMY_DATABASE_URL
 
+# Sync engine is kept for schema creation (``Base.metadata.create_all``) only.
 engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+async_engine = create_async_engine(
+    make_url(SQLALCHEMY_DATABASE_URL).set(drivername="postgresql+asyncpg")
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+
+@dataclass
+class QueryStats:
+    """Connection checkouts and statements issued while collecting, see ``collect_query_stats``."""
+
+    checkouts: int = 0
+    queries: int = 0
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
 
 
-def get_db():
-    db = SessionLocal()
+@event.listens_for(Pool, "checkout")
+def _count_checkout(dbapi_connection, connection_record, connection_proxy):
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.checkouts += 1
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.queries += 1
+
+
+@asynccontextmanager
+async def collect_query_stats():
+    """Count the checkouts and statements of every engine made inside the block."""
+    stats = QueryStats()
+    token = _query_stats.set(stats)
     try:
-        yield db
+        yield stats
     finally:
-        db.close()
+        _query_stats.reset(token)
+
+
+@asynccontextmanager
+async def unit_of_work(session_factory: async_sessionmaker = AsyncSessionLocal):
+    """
+    One session and one transaction for a whole request.
+
+    Repositories only flush their changes; they are committed once when the
+    block exits, or rolled back if it raises. Statements run on a single
+    connection checkout and share the session's identity map.
+    """
+    async with session_factory() as db:
+        try:
+            yield db
+        except BaseException:
+            await db.rollback()
+            raise
+        # A failed flush that the caller recovered from still leaves the
+        # transaction unusable; it can only be rolled back.
+        transaction = db.get_transaction()
+        if transaction is not None and transaction.is_active:
+            await db.commit()
+        else:
+            await db.rollback()
+
+
+def on_commit(db: AsyncSession, callback: Callable, *args):
+    """
+    Call ``callback(*args)`` once ``db``'s transaction has committed.
+
+    For side effects that must not be seen before the data is, such as cache
+    invalidation or waking up a worker. Dropped if the transaction rolls back.
+    """
+    db.sync_session.info.setdefault("on_commit", []).append((callback, args))
+
+
+@event.listens_for(Session, "after_commit")
+def _run_commit_callbacks(session: Session):
+    for callback, args in session.info.pop("on_commit", ()):
+        callback(*args)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_commit_callbacks(session: Session):
+    session.info.pop("on_commit", None)
+
+
+async def get_db():
+    async with unit_of_work() as db:
+        yield db
@@ -1,15 +1,28 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from .pg_database import unit_of_work
 from .settings import SQLALCHEMY_TEST_DATABASE_URL
 
 
 test_engine = create_engine(SQLALCHEMY_TEST_DATABASE_URL)
-TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+# NullPool: tests run each case (and each TestClient request) on its own event
+# loop, and asyncpg connections cannot be shared between loops.
+test_async_engine = create_async_engine(
+    make_url(SQLALCHEMY_TEST_DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    poolclass=NullPool,
+)
+TestSessionLocal = async_sessionmaker(
+    bind=test_async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 
-def get_test_db() -> TestSessionLocal:
-    db = TestSessionLocal()
-    try:
+async def get_test_db():
+    async with unit_of_work(TestSessionLocal) as db:
         yield db
-    finally:
-        db.close()
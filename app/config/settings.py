@@ -1,3 +1,4 @@
+import json
 import os
 from dotenv import load_dotenv
 
@@ -19,6 +20,24 @@ FRONTEND_URL = os.getenv("FRONTEND_URL")
 
 SENDER_EMAIL = os.getenv("SENDER_EMAIL")
 SENDER_PASSWORD = os.getenv("SENDER_PASSWORD")
+SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", 465))
+SMTP_USE_TLS = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
+SMTP_TIMEOUT_SECONDS = float(os.getenv("SMTP_TIMEOUT_SECONDS", 10))
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", 2))
+# Gmail drops idle connections after a few minutes
+SMTP_IDLE_TIMEOUT_SECONDS = float(os.getenv("SMTP_IDLE_TIMEOUT_SECONDS", 60))
+SMTP_MAX_MESSAGES_PER_CONNECTION = int(os.getenv("SMTP_MAX_MESSAGES_PER_CONNECTION", 100))
+
+# Email outbox worker; disable to run delivery in a separate process
+EMAIL_OUTBOX_WORKER_ENABLED = (
+    os.getenv("EMAIL_OUTBOX_WORKER_ENABLED", "true").lower() == "true"
+)
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", 20))
+EMAIL_OUTBOX_POLL_SECONDS = float(os.getenv("EMAIL_OUTBOX_POLL_SECONDS", 5))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", 6))
+EMAIL_OUTBOX_BACKOFF_SECONDS = float(os.getenv("EMAIL_OUTBOX_BACKOFF_SECONDS", 30))
+EMAIL_OUTBOX_BACKOFF_MAX_SECONDS = float(os.getenv("EMAIL_OUTBOX_BACKOFF_MAX_SECONDS", 3600))
 
 # OAuth ENVs
 GOOGLE_WEB_CLIENT_ID = os.getenv("GOOGLE_WEB_CLIENT_ID")
@@ -47,3 +66,39 @@ PYTEST_CURRENT_TEST = os.getenv("PYTEST_CURRENT_TEST")
 
 ZOHO_CLIENT_ID = os.getenv("ZOHO_CLIENT_ID")
 ZOHO_CLIENT_SECRET = os.getenv("ZOHO_CLIENT_SECRET")
+
+PERMISSION_CACHE_MAXSIZE = int(os.getenv("PERMISSION_CACHE_MAXSIZE", 1000))
+PERMISSION_CACHE_TTL_SECONDS = int(os.getenv("PERMISSION_CACHE_TTL_SECONDS", 3600))
+
+PASSWORD_HASH_MAX_WORKERS = int(
+    os.getenv("PASSWORD_HASH_MAX_WORKERS", min(4, os.cpu_count() or 1))
+)
+PASSWORD_HASH_ROUNDS = os.getenv("PASSWORD_HASH_ROUNDS")
+PASSWORD_HASH_TARGET_MS = int(os.getenv("PASSWORD_HASH_TARGET_MS", 250))
+PASSWORD_HASH_PARAMS_FILE = os.getenv("PASSWORD_HASH_PARAMS_FILE", "password_hash.json")
+PASSWORD_HASH_CALIBRATE_ON_STARTUP = (
+    os.getenv("PASSWORD_HASH_CALIBRATE_ON_STARTUP", "false").lower() == "true"
+)
+
+# Outbound HTTP (OAuth providers)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", 100))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20))
+HTTP_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", 60))
+OAUTH_CONNECT_TIMEOUT_SECONDS = float(os.getenv("OAUTH_CONNECT_TIMEOUT_SECONDS", 3))
+OAUTH_READ_TIMEOUT_SECONDS = float(os.getenv("OAUTH_READ_TIMEOUT_SECONDS", 5))
+# Per-provider overrides, e.g. {"yahoo": {"connect": 2, "read": 8}}
+OAUTH_PROVIDER_TIMEOUTS = json.loads(os.getenv("OAUTH_PROVIDER_TIMEOUTS", "{}"))
+# Upper bound for all provider calls of one OAuth login
+OAUTH_LOGIN_BUDGET_SECONDS = float(os.getenv("OAUTH_LOGIN_BUDGET_SECONDS", 10))
+# Consecutive provider failures that open its circuit, and how long it stays open
+OAUTH_BREAKER_FAILURE_THRESHOLD = int(os.getenv("OAUTH_BREAKER_FAILURE_THRESHOLD", 5))
+OAUTH_BREAKER_RECOVERY_SECONDS = float(os.getenv("OAUTH_BREAKER_RECOVERY_SECONDS", 30))
+OAUTH_BREAKER_HALF_OPEN_MAX_CALLS = int(os.getenv("OAUTH_BREAKER_HALF_OPEN_MAX_CALLS", 1))
+
+# Provider signing keys (JWKS), used when no Cache-Control max-age is sent
+JWKS_DEFAULT_MAX_AGE_SECONDS = int(os.getenv("JWKS_DEFAULT_MAX_AGE_SECONDS", 3600))
+JWKS_REFRESH_MARGIN_SECONDS = int(os.getenv("JWKS_REFRESH_MARGIN_SECONDS", 300))
+JWKS_MIN_REFRESH_INTERVAL_SECONDS = int(os.getenv("JWKS_MIN_REFRESH_INTERVAL_SECONDS", 30))
+
+# Rows fetched per round trip by the streaming export endpoints
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
@@ -0,0 +1,167 @@
+# Failure isolation and latency tracking for OAuth provider calls
+import asyncio
+import time
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Sequence
+
+import httpx
+
+from app.common.errors import ProviderUnavailableError
+from app.config.settings import (
+    OAUTH_BREAKER_FAILURE_THRESHOLD,
+    OAUTH_BREAKER_HALF_OPEN_MAX_CALLS,
+    OAUTH_BREAKER_RECOVERY_SECONDS,
+    OAUTH_LOGIN_BUDGET_SECONDS,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Errors that mean the provider, not the caller, is at fault
+PROVIDER_FAILURES = (httpx.TransportError, TimeoutError, ProviderUnavailableError)
+
+
+class LatencyHistogram:
+    """Cumulative latency histogram with fixed bucket bounds in milliseconds."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+
+    def observe(self, elapsed_ms: float):
+        self._counts[bisect_left(self.buckets, elapsed_ms)] += 1
+        self.count += 1
+        self.sum_ms += elapsed_ms
+
+    def stats(self) -> Dict[str, object]:
+        cumulative, buckets = 0, {}
+        for bound, count in zip((*self.buckets, "+Inf"), self._counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {"buckets": buckets, "count": self.count, "sum_ms": round(self.sum_ms, 3)}
+
+
+class CircuitBreaker:
+    """
+    Stops calling a provider after ``failure_threshold`` consecutive failures.
+
+    While open, calls fail immediately with ``ProviderUnavailableError``. Once
+    ``recovery_timeout`` has passed the breaker is half-open and lets up to
+    ``half_open_max_calls`` probes through: a successful probe closes it, a
+    failed one opens it again for another ``recovery_timeout``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = OAUTH_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = OAUTH_BREAKER_RECOVERY_SECONDS,
+        half_open_max_calls: int = OAUTH_BREAKER_HALF_OPEN_MAX_CALLS,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._probes = 0
+        self.latency = LatencyHistogram()
+
+    def before_call(self):
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                self._reject()
+            self.state = HALF_OPEN
+            self._probes = 0
+        if self.state == HALF_OPEN:
+            if self._probes >= self.half_open_max_calls:
+                self._reject()
+            self._probes += 1
+
+    def _reject(self):
+        self.rejected += 1
+        raise ProviderUnavailableError(
+            f"{self.name.capitalize()} login is temporarily unavailable, "
+            "please try again later."
+        )
+
+    def record_success(self):
+        self.state = CLOSED
+        self.failures = 0
+
+    def release(self):
+        """Give back a half-open probe slot whose call was abandoned."""
+        if self.state == HALF_OPEN:
+            self._probes = max(self._probes - 1, 0)
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "latency": self.latency.stats(),
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        breaker = _breakers[provider] = CircuitBreaker(provider)
+    return breaker
+
+
+@asynccontextmanager
+async def provider_call(provider: str, budget: Optional[float] = OAUTH_LOGIN_BUDGET_SECONDS):
+    """
+    Guard the provider calls made inside the block.
+
+    Fails fast while the provider's circuit is open, cancels the block once
+    ``budget`` seconds have passed and records its latency. Timeouts,
+    connection errors and ``ProviderUnavailableError`` count as provider
+    failures; anything else (bad codes, invalid tokens) means the provider
+    answered and counts as a success.
+    """
+    breaker = get_circuit_breaker(provider)
+    breaker.before_call()
+    started = time.perf_counter()
+    try:
+        async with asyncio.timeout(budget):
+            yield breaker
+    except PROVIDER_FAILURES as e:
+        breaker.record_failure()
+        if isinstance(e, ProviderUnavailableError):
+            raise
+        raise ProviderUnavailableError(
+            f"{provider.capitalize()} could not be reached, please try again later."
+        ) from e
+    except asyncio.CancelledError:
+        breaker.release()
+        raise
+    except Exception:
+        breaker.record_success()
+        raise
+    else:
+        breaker.record_success()
+    finally:
+        breaker.latency.observe((time.perf_counter() - started) * 1000)
+
+
+def provider_stats() -> Dict[str, Dict[str, object]]:
+    return {provider: breaker.stats() for provider, breaker in _breakers.items()}
@@ -0,0 +1,176 @@
+# Password hashing off the event loop
+import argparse
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+import bcrypt
+
+from app.config.settings import (
+    PASSWORD_HASH_MAX_WORKERS,
+    PASSWORD_HASH_PARAMS_FILE,
+    PASSWORD_HASH_ROUNDS,
+    PASSWORD_HASH_TARGET_MS,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROUNDS = 12
+MIN_ROUNDS = 10
+MAX_ROUNDS = 16
+
+
+def _time_hash(rounds: int) -> float:
+    salt = bcrypt.gensalt(rounds=rounds)
+    started = time.perf_counter()
+    bcrypt.hashpw(b"calibration-password", salt)
+    return (time.perf_counter() - started) * 1000
+
+
+def calibrate_rounds(
+    target_ms: int, min_rounds: int = MIN_ROUNDS, max_rounds: int = MAX_ROUNDS
+) -> Dict[str, Any]:
+    """
+    Benchmark bcrypt on this host and pick the highest cost within ``target_ms``.
+
+    Each extra round doubles the work, so the search stops at the first cost
+    that exceeds the target. ``min_rounds`` is kept even on slow hosts.
+    """
+    rounds, measured_ms = min_rounds, _time_hash(min_rounds)
+    for candidate in range(min_rounds + 1, max_rounds + 1):
+        elapsed_ms = _time_hash(candidate)
+        if elapsed_ms > target_ms:
+            break
+        rounds, measured_ms = candidate, elapsed_ms
+
+    return {
+        "algorithm": "bcrypt",
+        "rounds": rounds,
+        "target_ms": target_ms,
+        "measured_ms": round(measured_ms, 1),
+        "calibrated_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def save_parameters(parameters: Dict[str, Any], path: str = PASSWORD_HASH_PARAMS_FILE):
+    with open(path, "w") as file:
+        json.dump(parameters, file, indent=2)
+
+
+def load_rounds(path: str = PASSWORD_HASH_PARAMS_FILE) -> int:
+    """Cost to hash with: ``PASSWORD_HASH_ROUNDS``, then the recorded calibration, then bcrypt's default."""
+    if PASSWORD_HASH_ROUNDS:
+        return int(PASSWORD_HASH_ROUNDS)
+    try:
+        with open(path) as file:
+            return int(json.load(file)["rounds"])
+    except FileNotFoundError:
+        return DEFAULT_ROUNDS
+    except (ValueError, KeyError, TypeError):
+        logger.warning("Ignoring malformed password hash parameters in %s", path)
+        return DEFAULT_ROUNDS
+
+
+def get_rounds(hashed_password: str) -> Optional[int]:
+    """Cost encoded in a bcrypt hash (``$2b$<rounds>$...``), or None if unrecognised."""
+    parts = hashed_password.split("$")
+    if len(parts) != 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated, bounded thread pool.
+
+    bcrypt releases the GIL while hashing, so the event loop keeps serving
+    other requests; ``max_workers`` caps how many CPU cores a burst of logins
+    can occupy, and excess calls wait in the executor queue.
+    """
+
+    def __init__(self, max_workers: int, rounds: int = DEFAULT_ROUNDS):
+        self.max_workers = max_workers
+        self.rounds = rounds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        self._pending = 0
+        self.max_queued = 0
+        self.completed = 0
+
+    async def _run(self, func: Callable, *args):
+        self._pending += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+            self.completed += 1
+
+    @property
+    def in_flight(self) -> int:
+        return min(self._pending, self.max_workers)
+
+    @property
+    def queued(self) -> int:
+        return max(self._pending - self.max_workers, 0)
+
+    async def hash(self, password: str) -> str:
+        hashed_password = await self._run(
+            bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt(rounds=self.rounds)
+        )
+        return hashed_password.decode("utf-8")
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(
+            bcrypt.checkpw, password.encode("utf-8"), hashed_password.encode("utf-8")
+        )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Whether ``hashed_password`` was produced with other parameters than the current ones."""
+        return get_rounds(hashed_password) != self.rounds
+
+    def calibrate(self, target_ms: int = PASSWORD_HASH_TARGET_MS) -> Dict[str, Any]:
+        """Calibrate on this host, record the result and start hashing with it."""
+        parameters = calibrate_rounds(target_ms)
+        save_parameters(parameters)
+        self.rounds = parameters["rounds"]
+        logger.info("Password hashing calibrated: %s", parameters)
+        return parameters
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "max_workers": self.max_workers,
+            "rounds": self.rounds,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "completed": self.completed,
+        }
+
+
+password_hasher = PasswordHasher(
+    max_workers=PASSWORD_HASH_MAX_WORKERS, rounds=load_rounds()
+)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark bcrypt and record the cost meeting a target latency."
+    )
+    parser.add_argument("--target-ms", type=int, default=PASSWORD_HASH_TARGET_MS)
+    parser.add_argument("--output", default=PASSWORD_HASH_PARAMS_FILE)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Print the result without recording it."
+    )
+    args = parser.parse_args()
+
+    result = calibrate_rounds(args.target_ms)
+    if not args.dry_run:
+        save_parameters(result, args.output)
+    print(json.dumps(result, indent=2))
@@ -0,0 +1,96 @@
+# Shared outbound HTTP client
+import importlib.util
+from collections import Counter
+from typing import Dict, Optional
+
+import httpx
+
+from app.config.settings import (
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    OAUTH_CONNECT_TIMEOUT_SECONDS,
+    OAUTH_PROVIDER_TIMEOUTS,
+    OAUTH_READ_TIMEOUT_SECONDS,
+)
+
+_client: Optional[httpx.AsyncClient] = None
+# HTTP/2 needs the optional ``h2`` package (httpx[http2])
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+_requests_by_host: Counter = Counter()
+
+
+async def _count_request(request: httpx.Request):
+    _requests_by_host[request.url.host] += 1
+
+
+def _create_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=HTTP2_ENABLED,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        timeout=httpx.Timeout(
+            OAUTH_READ_TIMEOUT_SECONDS, connect=OAUTH_CONNECT_TIMEOUT_SECONDS
+        ),
+        event_hooks={"request": [_count_request]},
+    )
+
+
+async def start_http_client():
+    """Create the application-wide client; called from the app lifespan."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _create_client()
+
+
+async def close_http_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared client, so connections to providers are kept alive and
+    reused across requests. Created on first use when running without the
+    app lifespan (scripts, tests).
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _create_client()
+    return _client
+
+
+def provider_timeout(provider: str) -> httpx.Timeout:
+    """Connect/read timeouts for ``provider``, honouring ``OAUTH_PROVIDER_TIMEOUTS``."""
+    overrides = OAUTH_PROVIDER_TIMEOUTS.get(provider, {})
+    read = float(overrides.get("read", OAUTH_READ_TIMEOUT_SECONDS))
+    connect = float(overrides.get("connect", OAUTH_CONNECT_TIMEOUT_SECONDS))
+    return httpx.Timeout(read, connect=connect)
+
+
+def pool_stats() -> Dict[str, object]:
+    """Connection pool usage of the shared client."""
+    if _client is None:
+        return {
+            "http2": HTTP2_ENABLED,
+            "connections": 0,
+            "idle": 0,
+            "active": 0,
+            "requests": {},
+        }
+    # httpx does not expose its pool; httpcore's ConnectionPool does.
+    pool = getattr(_client._transport, "_pool", None)
+    connections = list(getattr(pool, "connections", []))
+    idle = sum(1 for connection in connections if connection.is_idle())
+    return {
+        "http2": HTTP2_ENABLED,
+        "connections": len(connections),
+        "idle": idle,
+        "active": len(connections) - idle,
+        "requests": dict(_requests_by_host),
+    }
@@ -0,0 +1,182 @@
+# Signing-key cache for OAuth provider ID tokens
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, Iterable, Optional
+
+import httpx
+from jose import jwt, JWTError
+
+from app.config.settings import (
+    JWKS_DEFAULT_MAX_AGE_SECONDS,
+    JWKS_MIN_REFRESH_INTERVAL_SECONDS,
+    JWKS_REFRESH_MARGIN_SECONDS,
+)
+from app.core.http import get_http_client
+
+logger = logging.getLogger(__name__)
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+def _max_age(headers: httpx.Headers) -> Optional[int]:
+    """Seconds the response may be cached for, from ``Cache-Control`` and ``Age``."""
+    match = _MAX_AGE.search(headers.get("cache-control", ""))
+    if not match:
+        return None
+    try:
+        age = int(headers.get("age", 0))
+    except ValueError:
+        age = 0
+    return max(int(match.group(1)) - age, 0)
+
+
+class JWKSCache:
+    """
+    Public keys of one identity provider, keyed by ``kid``.
+
+    Tokens are verified locally against the cached keys. The key set is
+    fetched on first use, refreshed in the background shortly before the
+    provider's ``max-age`` runs out, and re-fetched when a token names a key
+    we have not seen yet (providers rotate keys ahead of using them), at most
+    once per ``min_refresh_interval`` so forged ``kid`` values cannot make us
+    hammer the provider.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        issuers: Iterable[str],
+        algorithms: Iterable[str] = ("RS256",),
+        default_max_age: int = JWKS_DEFAULT_MAX_AGE_SECONDS,
+        refresh_margin: int = JWKS_REFRESH_MARGIN_SECONDS,
+        min_refresh_interval: int = JWKS_MIN_REFRESH_INTERVAL_SECONDS,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.name = name
+        self.url = url
+        self.issuers = tuple(issuers)
+        self.algorithms = list(algorithms)
+        self.default_max_age = default_max_age
+        self.refresh_margin = refresh_margin
+        self.min_refresh_interval = min_refresh_interval
+        self._client = client
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.fetches = 0
+
+    def seed(self, jwks: Dict[str, Any], max_age: Optional[int] = None):
+        """Load a key set directly, e.g. fixture keys in tests."""
+        self._keys = {key["kid"]: key for key in jwks.get("keys", []) if "kid" in key}
+        ttl = self.default_max_age if max_age is None else max_age
+        now = time.monotonic()
+        self._fetched_at = now
+        self._expires_at = now + ttl
+        # Short-lived key sets are refreshed half way rather than straight away.
+        self._refresh_at = now + max(ttl - self.refresh_margin, ttl / 2)
+
+    async def refresh(self):
+        """Fetch the provider's key set, unless another caller just did."""
+        fetched_at = self._fetched_at
+        async with self._lock:
+            if self._fetched_at != fetched_at:
+                return
+            client = self._client or get_http_client()
+            response = await client.get(self.url)
+            response.raise_for_status()
+            self.fetches += 1
+            self.seed(response.json(), _max_age(response.headers))
+
+    async def get_key(self, kid: str) -> Dict[str, Any]:
+        now = time.monotonic()
+        if now >= self._expires_at:
+            await self._refresh_or_keep_stale()
+        elif now >= self._refresh_at:
+            self._schedule_refresh()
+
+        key = self._keys.get(kid)
+        if key is None and time.monotonic() - self._fetched_at >= self.min_refresh_interval:
+            await self._refresh_or_keep_stale()
+            key = self._keys.get(kid)
+        if key is None:
+            raise JWTError(f"Unknown {self.name} signing key '{kid}'")
+        return key
+
+    async def verify(
+        self, token: str, audience: Optional[str], **options
+    ) -> Dict[str, Any]:
+        """
+        Verify ``token``'s signature, issuer, audience and expiry.
+
+        Raises:
+            JWTError: If the token is malformed, expired, not meant for
+                ``audience`` or not signed by one of the provider's keys.
+        """
+        header = jwt.get_unverified_header(token)
+        key = await self.get_key(header.get("kid"))
+        # ID tokens may carry ``at_hash``; we don't hold the matching access token.
+        options = {"verify_at_hash": False, **options}
+        return jwt.decode(
+            token,
+            key,
+            algorithms=self.algorithms,
+            audience=audience,
+            issuer=self.issuers,
+            options=options,
+        )
+
+    async def close(self):
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._refresh_task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "keys": len(self._keys),
+            "fetches": self.fetches,
+            "expires_in": max(self._expires_at - time.monotonic(), 0),
+        }
+
+    async def _refresh_or_keep_stale(self):
+        try:
+            await self.refresh()
+        except (httpx.HTTPError, ValueError) as e:
+            # A provider hiccup should not fail logins while we still hold keys.
+            if not self._keys:
+                raise JWTError(f"Unable to fetch {self.name} signing keys: {e}")
+            # Keep serving the old keys and retry after the minimum interval.
+            logger.warning("Keeping cached %s signing keys: %s", self.name, e)
+            now = time.monotonic()
+            self._fetched_at = now
+            self._expires_at = max(self._expires_at, now + self.min_refresh_interval)
+
+    def _schedule_refresh(self):
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_or_keep_stale())
+
+
+google_jwks = JWKSCache(
+    "Google",
+    "https://www.googleapis.com/oauth2/v3/certs",
+    issuers=("accounts.google.com", "https://accounts.google.com"),
+)
+apple_jwks = JWKSCache(
+    "Apple",
+    "https://appleid.apple.com/auth/keys",
+    issuers=("https://appleid.apple.com",),
+)
+
+
+async def close_jwks_caches():
+    """Cancel pending background refreshes; called from the app lifespan."""
+    for cache in (google_jwks, apple_jwks):
+        await cache.close()
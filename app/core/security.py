@@ -1 +1,82 @@
 # Security and authentication utilities
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Optional
+
+from fastapi import Request
+from jose import jwt, JWTError
+
+from app.common.enums import UserType
+from app.common.errors import InvalidTokenError
+from app.config.settings import JWT_SECRET_KEY, JWT_ALGORITHM
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Authenticated caller, built once per request from the verified access token.
+
+    ``claims`` holds the ``user``/``organisation`` section of the token; ``role``
+    and ``permissions`` are filled in by ``JWTBearerSecurity`` on routes that
+    require authorization.
+    """
+
+    entity_id: str
+    entity_type: int
+    user_type: Optional[int]
+    email: Optional[str]
+    claims: Dict[str, Any] = field(default_factory=dict)
+    otp_validated: bool = False
+    role: Optional[str] = None
+    permissions: Optional[FrozenSet[str]] = None
+
+    @property
+    def is_organisation(self) -> bool:
+        return self.entity_type == UserType.ORGANISATION.value
+
+    @classmethod
+    def from_token_payload(cls, payload: Dict[str, Any]) -> "Principal":
+        if payload.get("user"):
+            claims = payload["user"]
+            entity_id = claims.get("user_id")
+            entity_type = UserType.INDIVIDUAL_USER.value
+        elif payload.get("organisation"):
+            claims = payload["organisation"]
+            entity_id = claims.get("org_id")
+            entity_type = UserType.ORGANISATION.value
+        else:
+            raise InvalidTokenError("Invalid token payload.")
+        if not entity_id:
+            raise InvalidTokenError("Invalid token payload.")
+
+        return cls(
+            entity_id=entity_id,
+            entity_type=entity_type,
+            user_type=claims.get("user_type", payload.get("user_type")),
+            email=claims.get("email"),
+            claims=claims,
+            otp_validated=bool(payload.get("otp_validated")),
+        )
+
+
+def decode_access_token(token: str) -> Principal:
+    """Verify ``token`` and build the principal it identifies."""
+    try:
+        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+    except JWTError:
+        raise InvalidTokenError("Invalid or expired token.")
+    return Principal.from_token_payload(payload)
+
+
+def public(endpoint: Callable) -> Callable:
+    """Mark a route endpoint as reachable without an access token."""
+    endpoint.__public__ = True
+    return endpoint
+
+
+def is_public(endpoint: Optional[Callable]) -> bool:
+    return getattr(endpoint, "__public__", False)
+
+
+def get_principal(request: Request) -> Optional[Principal]:
+    """Return the principal authenticated for this request, if any."""
+    return getattr(request.state, "principal", None)
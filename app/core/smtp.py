@@ -0,0 +1,186 @@
+# Pooled SMTP connections for outgoing email
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from email.message import Message
+from typing import Dict, List, Optional, Sequence
+
+import aiosmtplib
+
+from app.config.settings import (
+    SENDER_EMAIL,
+    SENDER_PASSWORD,
+    SMTP_HOST,
+    SMTP_IDLE_TIMEOUT_SECONDS,
+    SMTP_MAX_MESSAGES_PER_CONNECTION,
+    SMTP_POOL_SIZE,
+    SMTP_PORT,
+    SMTP_TIMEOUT_SECONDS,
+    SMTP_USE_TLS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Errors after which the connection is dropped and the send retried once on a
+# fresh one: the server hung up, timed out, or answered 421 (closing channel).
+_RECONNECT_ERRORS = (
+    aiosmtplib.SMTPServerDisconnected,
+    aiosmtplib.SMTPTimeoutError,
+    ConnectionError,
+)
+
+
+class _Connection:
+    def __init__(self, smtp: aiosmtplib.SMTP):
+        self.smtp = smtp
+        self.sent = 0
+        self.last_used = time.monotonic()
+
+
+class SMTPConnectionPool:
+    """
+    Keeps up to ``size`` authenticated SMTP connections open and reuses them.
+
+    Connections idle for longer than ``idle_timeout`` are closed rather than
+    reused (servers drop them anyway) and each connection is retired after
+    ``max_messages`` messages. When the server drops a connection mid-send the
+    remaining messages are retried once on a new connection.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = True,
+        size: int = SMTP_POOL_SIZE,
+        idle_timeout: float = SMTP_IDLE_TIMEOUT_SECONDS,
+        max_messages: int = SMTP_MAX_MESSAGES_PER_CONNECTION,
+        timeout: float = SMTP_TIMEOUT_SECONDS,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.max_messages = max_messages
+        self.timeout = timeout
+        self._idle: List[_Connection] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.in_use = 0
+        self.connects = 0
+        self.reconnects = 0
+        self.sent = 0
+
+    def _bind_loop(self):
+        # Connections belong to the event loop that opened them.
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.size)
+            self._idle = []
+
+    async def _connect(self) -> _Connection:
+        smtp = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            timeout=self.timeout,
+        )
+        await smtp.connect()
+        self.connects += 1
+        return _Connection(smtp)
+
+    @staticmethod
+    async def _close(connection: _Connection):
+        try:
+            if connection.smtp.is_connected:
+                await connection.smtp.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            connection.smtp.close()
+
+    async def _checkout(self) -> _Connection:
+        while self._idle:
+            connection = self._idle.pop()
+            expired = time.monotonic() - connection.last_used > self.idle_timeout
+            if connection.smtp.is_connected and not expired:
+                return connection
+            await self._close(connection)
+        return await self._connect()
+
+    async def _checkin(self, connection: _Connection):
+        connection.last_used = time.monotonic()
+        if connection.sent >= self.max_messages:
+            await self._close(connection)
+        else:
+            self._idle.append(connection)
+
+    @asynccontextmanager
+    async def connection(self):
+        """Borrow a connection; it is discarded instead of returned on errors."""
+        self._bind_loop()
+        async with self._semaphore:
+            connection = await self._checkout()
+            self.in_use += 1
+            try:
+                yield connection
+            except BaseException:
+                connection.smtp.close()
+                raise
+            else:
+                await self._checkin(connection)
+            finally:
+                self.in_use -= 1
+
+    async def send_many(self, messages: Sequence[Message]):
+        """Send ``messages`` back to back over a single connection."""
+        pending = list(messages)
+        for attempt in range(2):
+            try:
+                async with self.connection() as connection:
+                    while pending:
+                        await connection.smtp.send_message(pending[0])
+                        pending.pop(0)
+                        connection.sent += 1
+                        self.sent += 1
+                return
+            except (*_RECONNECT_ERRORS, aiosmtplib.SMTPResponseException) as e:
+                retryable = not isinstance(e, aiosmtplib.SMTPResponseException) or e.code == 421
+                if attempt or not retryable:
+                    raise
+                self.reconnects += 1
+                logger.warning("SMTP connection lost, reconnecting: %s", e)
+
+    async def send(self, message: Message):
+        await self.send_many([message])
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await self._close(connection)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "in_use": self.in_use,
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "sent": self.sent,
+        }
+
+
+smtp_pool = SMTPConnectionPool(
+    hostname=SMTP_HOST,
+    port=SMTP_PORT,
+    username=SENDER_EMAIL,
+    password=SENDER_PASSWORD,
+    use_tls=SMTP_USE_TLS,
+)
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
@@ -6,20 +8,54 @@ from fastapi.staticfiles import StaticFiles
 
 from app.api.error_handlers import setup_error_handlers
 from app.api.config import router
+from app.api.response import FastJSONResponse
 from app.models.base import Base
 from app.config.pg_database import engine
 from app.config.pg_test_database import test_engine
 from app.middlewares.jwt_auth import JWTAuthMiddleware
-from app.config.settings import PROFILE_PICTURE_DIR
+from app.middlewares.query_stats import (
+    CHECKOUTS_HEADER,
+    QUERIES_HEADER,
+    QueryStatsMiddleware,
+)
+from app.config.settings import (
+    EMAIL_OUTBOX_WORKER_ENABLED,
+    PASSWORD_HASH_CALIBRATE_ON_STARTUP,
+    PROFILE_PICTURE_DIR,
+)
+from app.core.security import public
+from app.core.hashing import password_hasher
+from app.core.http import close_http_client, start_http_client
+from app.core.jwks import close_jwks_caches
+from app.core.smtp import smtp_pool
+from app.services.email import email_outbox_worker
 
 # Create the database schema
 Base.metadata.create_all(bind=engine)
 Base.metadata.create_all(bind=test_engine)
 
-# Initialize the FastAPI app with CORS and JWT middlewares
+if PASSWORD_HASH_CALIBRATE_ON_STARTUP:
+    password_hasher.calibrate()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await start_http_client()
+    if EMAIL_OUTBOX_WORKER_ENABLED:
+        email_outbox_worker.start()
+    yield
+    await email_outbox_worker.stop()
+    await close_jwks_caches()
+    await smtp_pool.close()
+    await close_http_client()
+
+
+# Initialize the FastAPI app with CORS, query stats and JWT middlewares
 app = FastAPI(
     title="Gnostic",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     middleware=[
         Middleware(
             CORSMiddleware,
@@ -27,7 +63,9 @@ app = FastAPI(
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=[CHECKOUTS_HEADER, QUERIES_HEADER],
         ),
+        Middleware(QueryStatsMiddleware),
         Middleware(JWTAuthMiddleware),
     ],
 )
@@ -35,6 +73,7 @@ app = FastAPI(
 
 # Health check endpoint
 @app.get("/")
+@public
 def health_check():
     return {"message": "GNOSTIC"}
 
@@ -1,69 +1,120 @@
 import re
-
-from app.common.enums import UserType
+from dataclasses import replace
+from functools import lru_cache
 
 from app.services.permission import PermissionService
 from fastapi import Depends, HTTPException, status, Request
-
-# from starlette import status
-from jose import jwt, JWTError
-from cachetools import TTLCache
-from sqlalchemy.orm import Session
-
-# from starlette.requests import Request
-from typing import Optional, Dict, List
-from starlette.responses import Response
+from typing import FrozenSet, Iterable, List, Optional
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Receive, Scope, Send
 from fastapi.security.utils import get_authorization_scheme_param
-from starlette.middleware.base import RequestResponseEndpoint
 
 from app.api.response import APIResponse
 from app.common.context import UserContext
-from app.middlewares.base import BaseMiddleware
-from app.common.errors import InvalidAuthorizationHeaderError
-from app.config.settings import JWT_SECRET_KEY, JWT_ALGORITHM, JWT_TYPE
-from app.common.constants import UNPROTECTED_ROUTE_PATHS, TRAILING_SLASH
-
-
-class JWTAuthMiddleware(BaseMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        url_path = (
-            request.url.path[:-1]
-            if request.url.path[-1] == TRAILING_SLASH
-            else request.url.path
+from app.common.errors import InvalidAuthorizationHeaderError, InvalidTokenError
+from app.config.settings import JWT_TYPE
+from app.core.security import Principal, decode_access_token, get_principal, is_public
+from app.common.constants import (
+    PUBLIC_PATH_CACHE_SIZE,
+    TRAILING_SLASH,
+    UNPROTECTED_ROUTE_PATHS,
+)
+
+
+class PublicPathMatcher:
+    """
+    Decides whether a request path skips authentication.
+
+    Static public routes go into a set for an exact lookup; parameterised
+    public routes and ``UNPROTECTED_ROUTE_PATHS`` are folded into a single
+    compiled pattern. Decisions are memoised per path.
+    """
+
+    def __init__(self, routes: Iterable[BaseRoute], patterns: List[str]):
+        exact_paths = set()
+        regexes = list(patterns)
+        for route in routes:
+            if not is_public(getattr(route, "endpoint", None)):
+                continue
+            if "{" in route.path:
+                regexes.append(route.path_regex.pattern)
+            else:
+                exact_paths.add(self.normalize(route.path))
+
+        self._exact_paths = frozenset(exact_paths)
+        self._pattern = (
+            re.compile("|".join(f"(?:{regex})" for regex in regexes))
+            if regexes
+            else None
         )
-        if any(re.search(pattern, url_path) for pattern in UNPROTECTED_ROUTE_PATHS):
-            return await call_next(request)
+        self.is_public = lru_cache(maxsize=PUBLIC_PATH_CACHE_SIZE)(self._is_public)
 
-        try:
-            access_jwt = self._validate_authorization_header(request=request)
-            payload = jwt.decode(
-                token=access_jwt,
-                key=JWT_SECRET_KEY,
-                algorithms=[JWT_ALGORITHM],
-            )
-            payload = (
-                payload.get("user")
-                if payload.get("user")
-                else payload.get("organisation")
+    @staticmethod
+    def normalize(path: str) -> str:
+        return path[:-1] if path.endswith(TRAILING_SLASH) else path
+
+    def _is_public(self, path: str) -> bool:
+        url_path = self.normalize(path)
+        if url_path in self._exact_paths:
+            return True
+        return bool(self._pattern and self._pattern.search(url_path))
+
+
+class JWTAuthMiddleware:
+    """
+    Authenticates HTTP requests from the ASGI scope.
+
+    Works on the raw scope instead of wrapping requests in ``BaseHTTPMiddleware``
+    so responses (including streaming ones) pass straight through to ``send``.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._matcher: Optional[PublicPathMatcher] = None
+
+    def _get_matcher(self, scope: Scope) -> PublicPathMatcher:
+        # Built on the first request, once every router has been included.
+        if self._matcher is None:
+            self._matcher = PublicPathMatcher(
+                scope["app"].routes, UNPROTECTED_ROUTE_PATHS
             )
-            context_token = UserContext.set(payload)
-            request.state.jwt_payload = payload
+        return self._matcher
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        except Exception as exc:
-            return APIResponse.error(
+        if self._get_matcher(scope).is_public(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            access_jwt = self._validate_authorization_header(scope=scope)
+            principal = decode_access_token(access_jwt)
+        except Exception:
+            response = APIResponse.error(
                 message="Invalid or expired token.",
                 status_code=status.HTTP_401_UNAUTHORIZED,
             )
+            await response(scope, receive, send)
+            return
 
-        response = await call_next(request)
-        UserContext.reset(context_token)
-        return response
+        # ``request.state`` is backed by ``scope["state"]``
+        scope.setdefault("state", {})["principal"] = principal
+        context_token = UserContext.set(principal)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            UserContext.reset(context_token)
 
     @staticmethod
-    def _validate_authorization_header(request: Request) -> str:
-        authorization = request.headers.get("Authorization")
+    def _validate_authorization_header(scope: Scope) -> str:
+        authorization = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value.decode("latin-1")
+                break
         scheme, token = get_authorization_scheme_param(
             authorization_header_value=authorization
         )
@@ -74,26 +125,11 @@ class JWTAuthMiddleware(BaseMiddleware):
         return token
 
 
-role_permission_cache = TTLCache(maxsize=1000, ttl=3600)
-
-
 class JWTBearerSecurity:
     def __init__(self, permission: Optional[str] = None):
         self.required_permission = permission
 
-    def verify_token(self, token: str) -> dict:
-        """Decode and verify the JWT token."""
-        try:
-            payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-            return payload
-        except JWTError:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired token.",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-    def check_permission(self, user_permissions: list):
+    def check_permission(self, user_permissions: FrozenSet[str]):
         """Check if the required permission exists for the user's role."""
         if (
             self.required_permission
@@ -106,9 +142,27 @@ class JWTBearerSecurity:
 
     async def __call__(
         self, request: Request, service: PermissionService = Depends(PermissionService)
-    ):
-        """Authenticate and authorize the current user."""
-        # Extract and validate Authorization Header
+    ) -> Principal:
+        """Authorize the principal authenticated by ``JWTAuthMiddleware``."""
+        principal = get_principal(request)
+        if principal is None:
+            # Route is exempt from the middleware; authenticate here instead.
+            principal = self._authenticate(request)
+            UserContext.set(principal)
+
+        if principal.permissions is None:
+            role = await service.get_entity_role(
+                principal.entity_id, principal.entity_type
+            )
+            permissions = await service.get_role_permissions(role)
+            principal = replace(principal, role=role, permissions=permissions)
+            request.state.principal = principal
+            UserContext.set(principal)
+
+        self.check_permission(principal.permissions)
+        return principal
+
+    def _authenticate(self, request: Request) -> Principal:
         authorization = request.headers.get("Authorization")
         if not authorization:
             raise HTTPException(
@@ -122,31 +176,15 @@ class JWTBearerSecurity:
                 "Invalid authorization header scheme."
             )
 
-        # Verify the token and extract payload
-        payload = self.verify_token(token)
-        if payload.get("user"):
-            entity_id = payload["user"]["user_id"]
-            entity_type = UserType.INDIVIDUAL_USER.value
-        elif payload.get("organisation"):
-            entity_id = payload["organisation"]["org_id"]
-            entity_type = UserType.ORGANISATION.value
-        else:
+        try:
+            return decode_access_token(token)
+        except InvalidTokenError:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid token payload."
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token.",
+                headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # Set user context
-        context_token = UserContext.set(payload)
-        request.state.jwt_payload = payload
-
-        # Fetch the user's permissions
-        user_permissions = await service.get_user_permissions(entity_id, entity_type)
-
-        # Check if the required permission is present
-        self.check_permission(user_permissions)
-
-        return context_token
-
     @staticmethod
     def _get_authorization_scheme_param(authorization_header_value: str):
         parts = authorization_header_value.split()
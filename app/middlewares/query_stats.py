@@ -0,0 +1,37 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.pg_database import collect_query_stats
+
+CHECKOUTS_HEADER = "X-DB-Checkouts"
+QUERIES_HEADER = "X-DB-Queries"
+
+
+class QueryStatsMiddleware:
+    """
+    Reports how many pool checkouts and SQL statements a request needed.
+
+    The counts are added as ``X-DB-Checkouts`` and ``X-DB-Queries`` response
+    headers. The request's unit of work commits before the response starts,
+    so its commit is included; queries made while a streaming body is being
+    sent are not.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with collect_query_stats() as stats:
+
+            async def send_with_stats(message: Message):
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers[CHECKOUTS_HEADER] = str(stats.checkouts)
+                    headers[QUERIES_HEADER] = str(stats.queries)
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
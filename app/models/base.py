@@ -1,8 +1,23 @@
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, TIMESTAMP, String, func
+from sqlalchemy import DDL, Column, Index, TIMESTAMP, String, event, func
 
 Base = declarative_base()
 
+# Trigram indexes used by repository search need the pg_trgm extension
+event.listen(
+    Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+)
+
+
+def trigram_index(table_name: str, column_name: str) -> Index:
+    """GIN trigram index serving ILIKE and similarity search on ``column_name``."""
+    return Index(
+        f"ix_{table_name}_{column_name}_trgm",
+        column_name,
+        postgresql_using="gin",
+        postgresql_ops={column_name: "gin_trgm_ops"},
+    )
+
 
 class BaseModel(Base):
     __abstract__ = True
@@ -0,0 +1,40 @@
+import uuid
+from sqlalchemy import Column, Index, Integer, String, Text, TIMESTAMP, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+
+from app.common.enums import EmailStatus
+from .base import BaseModel
+
+
+class EmailOutbox(BaseModel):
+    """
+    Email waiting to be delivered by the outbox worker.
+
+    Requests only insert rows here; ``EmailOutboxWorker`` sends them in the
+    background, retrying with backoff until ``EMAIL_OUTBOX_MAX_ATTEMPTS``
+    after which the row is marked dead.
+    """
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # Only pending rows are polled, so keep the index to those.
+        Index(
+            "ix_email_outbox_pending",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    uuid = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    recipients = Column(ARRAY(String), nullable=False)
+    subject = Column(String, nullable=False)
+    body = Column(Text, nullable=False)
+    status = Column(
+        String, nullable=False, default=EmailStatus.PENDING.value, index=True
+    )
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
+    last_error = Column(Text, nullable=True)
+    sent_at = Column(TIMESTAMP(timezone=True), nullable=True)
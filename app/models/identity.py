@@ -0,0 +1,72 @@
+# Identity index shared by users and organisations, keyed by lowercase email.
+from sqlalchemy import CheckConstraint, Column, DDL, ForeignKey, String, event
+from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID
+
+from .base import Base
+
+
+class Identity(Base):
+    """
+    One row per login email across ``users`` and ``organisations``.
+
+    Rows are maintained by database triggers on both tables (see
+    ``IDENTITY_TRIGGERS_DDL``), so the primary key on the lowercased email
+    rejects case-insensitive duplicates across the two tables.
+    """
+
+    __tablename__ = "identities"
+    __table_args__ = (
+        CheckConstraint(
+            "num_nonnulls(user_id, organisation_id) = 1",
+            name="ck_identities_single_owner",
+        ),
+    )
+
+    email = Column(String, primary_key=True)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.uuid", ondelete="CASCADE"),
+        unique=True,
+        nullable=True,
+    )
+    organisation_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organisations.uuid", ondelete="CASCADE"),
+        unique=True,
+        nullable=True,
+    )
+    user = relationship("User")
+    organisation = relationship("Organisation")
+
+
+def _sync_identity_function(table_name: str, owner_column: str) -> str:
+    return f"""
+CREATE OR REPLACE FUNCTION sync_{table_name}_identity() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.email IS NOT DISTINCT FROM NEW.email THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.email IS NOT NULL THEN
+        DELETE FROM identities WHERE {owner_column} = OLD.uuid;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.email IS NOT NULL THEN
+        INSERT INTO identities (email, {owner_column}) VALUES (lower(NEW.email), NEW.uuid);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS {table_name}_identity ON {table_name};
+CREATE TRIGGER {table_name}_identity
+    AFTER INSERT OR UPDATE OF email OR DELETE ON {table_name}
+    FOR EACH ROW EXECUTE FUNCTION sync_{table_name}_identity();
+"""
+
+
+IDENTITY_TRIGGERS_DDL = _sync_identity_function(
+    "users", "user_id"
+) + _sync_identity_function("organisations", "organisation_id")
+
+
+event.listen(Identity.__table__, "after_create", DDL(IDENTITY_TRIGGERS_DDL))
@@ -3,11 +3,15 @@ from sqlalchemy import Column, String, Integer, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 
-from .base import BaseModel
+from .base import BaseModel, trigram_index
 
 
 class Permission(BaseModel):
     __tablename__ = "permissions"
+    __table_args__ = (
+        trigram_index("permissions", "name"),
+        trigram_index("permissions", "description"),
+    )
 
     uuid = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, unique=True, nullable=False)
@@ -3,11 +3,15 @@ from sqlalchemy import String, Table, Column, ForeignKey, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 
-from .base import BaseModel
+from .base import BaseModel, trigram_index
 
 
 class Role(BaseModel):
     __tablename__ = "roles"
+    __table_args__ = (
+        trigram_index("roles", "name"),
+        trigram_index("roles", "description"),
+    )
 
     uuid = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False, unique=True)
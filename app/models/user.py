@@ -4,12 +4,17 @@ from sqlalchemy import Column, String, Integer, ForeignKey, JSON, TIMESTAMP
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 
-from .base import BaseModel
+from .base import BaseModel, trigram_index
 from app.models.language import UserLanguage
 
 
 class User(BaseModel):
     __tablename__ = "users"
+    __table_args__ = (
+        trigram_index("users", "first_name"),
+        trigram_index("users", "last_name"),
+        trigram_index("users", "email"),
+    )
 
     uuid = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     first_name = Column(String, nullable=False)
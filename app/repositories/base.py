@@ -1,159 +1,188 @@
+import asyncio
+
 from pydantic import BaseModel
-from sqlalchemy.sql import exists, text
-from sqlalchemy import asc, desc, or_, text, update, delete, select
-from sqlalchemy.orm import Session, joinedload
-from typing import List, Dict, Optional, Type, Tuple
+from sqlalchemy.sql import exists
+from sqlalchemy import and_, asc, desc, inspect, or_, tuple_, update, delete, select
+from sqlalchemy.orm import joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, List, Dict, Optional, Sequence, Type, Tuple, Union
 from sqlalchemy.sql.expression import func
 from math import ceil
 
-from sqlalchemy.testing.util import total_size
-
+from app.common.constants import DEFAULT_CURSOR_PAGE_SIZE
+from app.common.utils import decode_cursor, encode_cursor, escape_like
+from app.config.settings import EXPORT_BATCH_SIZE
 from app.schemas.pagination import PaginationDetails
-from ..config.pg_database import get_db
+from ..config.pg_database import AsyncSessionLocal
 
 
 class BaseRepository:
     # model: Type[BaseModel] = None
     ModelClass = BaseModel
+    # Columns that may be passed as ``search_columns``; each one is backed by a
+    # pg_trgm GIN index so both ILIKE and similarity matching stay indexed.
+    SEARCHABLE_COLUMNS: Tuple[str, ...] = ()
+    # Projected fields that live on a related table, as
+    # field name -> (relationship name, column name)
+    RELATED_FIELDS: Dict[str, Tuple[str, str]] = {}
 
     @staticmethod
-    def get_db():
-        return next(get_db())
+    def get_db() -> AsyncSession:
+        return AsyncSessionLocal()
 
     @classmethod
-    async def exists(cls, db: Session, **kwargs) -> bool:
-        try:
-            query = select(
-                exists().where(
-                    *[
-                        getattr(cls.ModelClass, key) == value
-                        for key, value in kwargs.items()
-                    ]
-                )
+    async def exists(cls, db: AsyncSession, **kwargs) -> bool:
+        query = select(
+            exists().where(
+                *[getattr(cls.ModelClass, key) == value for key, value in kwargs.items()]
             )
-            result = db.execute(query)
-            return result.scalar()
-        finally:
-            db.close()
+        )
+        result = await db.execute(query)
+        return result.scalar()
 
     @staticmethod
-    async def create(db: Session, instance: BaseModel):
-        try:
-            db.add(instance)
-            db.commit()
-            db.refresh(instance)
-            return instance
-        except Exception as e:
-            db.rollback()
-            raise e
-        finally:
-            db.close()
+    async def create(db: AsyncSession, instance: BaseModel):
+        # Flushed, not committed: the request's unit of work commits once at
+        # the end (see ``unit_of_work``). The refresh loads server defaults.
+        db.add(instance)
+        await db.flush()
+        await db.refresh(instance)
+        return instance
 
     @classmethod
     async def get_one(
-        cls, db: Session, options: List = None, include_role: bool = False, **kwargs
+        cls, db: AsyncSession, options: List = None, include_role: bool = False, **kwargs
     ) -> Optional[BaseModel]:
-        try:
-            query = select(cls.ModelClass)
-            if include_role:
-                query = query.options(joinedload(cls.ModelClass.role))
-            if options:
-                query = query.options(*options)
-            if kwargs:
-                query = query.filter_by(**kwargs)
-            result = db.execute(query)
-            return result.scalars().one_or_none()
-        finally:
-            db.close()
+        query = select(cls.ModelClass)
+        if include_role:
+            query = query.options(joinedload(cls.ModelClass.role))
+        if options:
+            query = query.options(*options)
+        if kwargs:
+            query = query.filter_by(**kwargs)
+        result = await db.execute(query)
+        return result.scalars().one_or_none()
 
     @classmethod
     async def get_all(
         cls,
-        db: Session,
+        db: AsyncSession,
         include_role: bool = False,
         order_by: Optional[List[Tuple[str, bool]]] = None,
         search: Optional[str] = None,
         search_columns: Optional[List[str]] = None,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
+        projection: Optional[Union[Type[BaseModel], Sequence[str]]] = None,
         **kwargs,
     ) -> List[BaseModel]:
-        try:
+        if projection is not None:
+            query = cls._select_projection(projection)
+        else:
             query = select(cls.ModelClass)
             if include_role:
                 query = query.options(joinedload(cls.ModelClass.role))
 
-            if kwargs:
-                query = query.filter_by(**kwargs)
-
-            if search and search_columns:
-                conditions = [text(f"{col} ILIKE :search") for col in search_columns]
-                query = query.filter(or_(*conditions)).params(search=f"%{search}%")
-
-            if order_by:
-                order_clauses = []
-                for column_name, is_descending in order_by:
-                    column = getattr(cls.ModelClass, column_name, None)
-                    if column is not None:
-                        order_clauses.append(
-                            desc(column) if is_descending else asc(column)
-                        )
-                    else:
-                        raise ValueError(
-                            f"Invalid column name '{column_name}' for sorting"
-                        )
-                query = query.order_by(*order_clauses)
-
-            if page and page_size:
-                offset = (page - 1) * page_size
-                query = query.offset(offset).limit(page_size)
-
-            result = db.execute(query)
-            return result.scalars().all()
-        finally:
-            db.close()
+        if kwargs:
+            query = query.filter(*cls._filter_conditions(kwargs))
+
+        query, rank = cls._apply_search(query, search, search_columns)
+        if rank is not None:
+            query = query.order_by(desc(rank))
+
+        if order_by:
+            order_clauses = []
+            for column_name, is_descending in order_by:
+                column = getattr(cls.ModelClass, column_name, None)
+                if column is not None:
+                    order_clauses.append(desc(column) if is_descending else asc(column))
+                else:
+                    raise ValueError(f"Invalid column name '{column_name}' for sorting")
+            query = query.order_by(*order_clauses)
+
+        if page and page_size:
+            offset = (page - 1) * page_size
+            query = query.offset(offset).limit(page_size)
+
+        result = await db.execute(query)
+        return result.all() if projection is not None else result.scalars().all()
 
     @classmethod
     async def get_paginated(
             cls,
-            db: Session,
+            db: AsyncSession,
             page: Optional[int] = None,
             page_size: Optional[int] = None,
             include_role: bool = False,
             order_by: Optional[List[Tuple[str, bool]]] = None,
             search: Optional[str] = None,
             search_columns: Optional[List[str]] = None,
+            concurrent_count: bool = False,
+            cursor: Optional[str] = None,
+            projection: Optional[Union[Type[BaseModel], Sequence[str]]] = None,
             **kwargs,
     ):
         """
         Retrieve paginated data with metadata.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             page (Optional[int]): Current page number.
             page_size (Optional[int]): Number of records per page.
             include_role (bool): Whether to include related roles.
             order_by (Optional[List[Tuple[str, bool]]]): Columns for sorting.
             search (Optional[str]): Search term.
             search_columns (Optional[List[str]]): Columns to search in.
+            concurrent_count (bool): Run the count query on a separate session,
+                concurrently with the page query.
+            cursor (Optional[str]): Switches to keyset pagination when not None.
+                An empty string starts from the first row, any other value must be
+                a ``next_cursor`` returned by a previous call with the same ordering.
+            projection (Optional[Union[Type[BaseModel], Sequence[str]]]): Return
+                rows of these columns instead of model instances, see
+                ``_select_projection``. ``include_role`` is ignored.
             **kwargs: Additional filters.
 
         Returns:
             Tuple[List, PaginationDetails]: Paginated data with metadata.
         """
-        query = select(cls.ModelClass)
-
-        if include_role:
-            query = query.options(joinedload(cls.ModelClass.role))
+        if projection is not None:
+            # Keyset cursors are built from the ordering columns of the last row.
+            sort_columns = [name for name, _ in order_by or [("created_at", True)]]
+            query = cls._select_projection(
+                projection, required=[*sort_columns, "uuid"] if cursor is not None else ()
+            )
+        else:
+            query = select(cls.ModelClass)
 
         # Apply filters from kwargs
         if kwargs:
-            query = query.filter_by(**kwargs)
+            query = query.filter(*cls._filter_conditions(kwargs))
 
         # Apply search conditions
-        if search and search_columns:
-            conditions = [text(f"{col} ILIKE :search") for col in search_columns]
-            query = query.filter(or_(*conditions)).params(search=f"%{search}%")
+        query, rank = cls._apply_search(query, search, search_columns)
+
+        # Count over the filtered query before eager loads and ordering are added
+        count_query = select(func.count()).select_from(query.subquery())
+
+        if include_role and projection is None:
+            query = query.options(joinedload(cls.ModelClass.role))
+
+        if cursor is not None:
+            return await cls._get_keyset_page(
+                db,
+                query,
+                count_query,
+                cursor,
+                page_size,
+                order_by,
+                concurrent_count,
+                rows=projection is not None,
+            )
+
+        # Best matches first; the requested ordering breaks ties
+        if rank is not None:
+            query = query.order_by(desc(rank))
 
         # Apply ordering
         if order_by:
@@ -166,10 +195,9 @@ class BaseRepository:
                     raise ValueError(f"Invalid column name '{column_name}' for sorting")
             query = query.order_by(*order_clauses)
 
-        result = db.execute(query)
-        data = result.scalars().all()
-
         if page is None or page_size is None:
+            result = await db.execute(query)
+            data = result.all() if projection is not None else result.scalars().all()
             pagination_details = PaginationDetails(
                 current_page=1,
                 page_size=len(data),
@@ -178,22 +206,21 @@ class BaseRepository:
             )
             return data, pagination_details
 
-        # Get total count
-        # total_count_query = select(func.count()).select_from(cls.ModelClass)
-        # total_count_result = db.execute(total_count_query)
-        # total_count = total_count_result.scalar()
-
-        total_count = len(data)
-        total_pages = ceil(total_count / page_size) if total_count > 0 else 1
-
         # Apply pagination
         offset = (page - 1) * page_size
         query = query.offset(offset).limit(page_size)
 
-        # Fetch paginated results
-        result = db.execute(query)
-        data = result.scalars().all()
+        # Fetch the page and the total count
+        if concurrent_count:
+            total_count, result = await asyncio.gather(
+                cls._count(count_query), db.execute(query)
+            )
+        else:
+            total_count = (await db.execute(count_query)).scalar_one()
+            result = await db.execute(query)
+        data = result.all() if projection is not None else result.scalars().all()
 
+        total_pages = ceil(total_count / page_size) if total_count > 0 else 1
         pagination_details = PaginationDetails(
             current_page=page,
             page_size=page_size,
@@ -202,33 +229,254 @@ class BaseRepository:
         )
         return data, pagination_details
 
-
     @classmethod
-    async def update_all(cls, db: Session, data: Dict[str, any], **kwargs):
+    async def stream(
+        cls,
+        projection: Union[Type[BaseModel], Sequence[str]],
+        search: Optional[str] = None,
+        search_columns: Optional[List[str]] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+        **kwargs,
+    ) -> AsyncIterator[Sequence]:
+        """
+        Yield all matching rows in batches of ``batch_size``, read through a
+        server-side cursor so memory use does not grow with the result set.
+
+        The rows are read on a session of their own, which stays open until the
+        generator is exhausted or closed: a response streaming the rows outlives
+        the request's ``get_db`` session.
+
+        Args:
+            projection: Columns to select, see ``_select_projection``.
+            search (Optional[str]): Search term, see ``_apply_search``.
+            search_columns (Optional[List[str]]): Columns to search in.
+            batch_size (int): Rows fetched from the cursor per round trip.
+            **kwargs: Additional filters.
+        """
+        query = cls._select_projection(projection)
+        if kwargs:
+            query = query.filter(*cls._filter_conditions(kwargs))
+        query, _ = cls._apply_search(query, search, search_columns)
+
+        db = cls.get_db()
         try:
-            query = update(cls.ModelClass).values(data)
-            if kwargs:
-                query = query.filter_by(**kwargs)
-            db.execute(query)
-            db.commit()
+            result = await db.stream(query.execution_options(yield_per=batch_size))
+            async for rows in result.partitions():
+                yield rows
         finally:
-            db.close()
+            await db.close()
 
     @classmethod
-    async def delete(cls, db: Session, instance: BaseModel):
-        try:
-            db.delete(instance)
-            db.commit()
-        finally:
-            db.close()
+    def _select_projection(
+        cls,
+        projection: Union[Type[BaseModel], Sequence[str]],
+        required: Sequence[str] = (),
+    ):
+        """
+        Build a select of only the columns a caller needs.
+
+        ``projection`` is either a list of column names or a response schema,
+        whose field names are taken as the column names. Fields listed in
+        ``RELATED_FIELDS`` are read from the related table through an outer
+        join; other schema fields without a column are left to their defaults.
+        Rows expose each value under the field name.
+
+        Args:
+            projection: Column names, or a pydantic schema.
+            required: Extra columns to select, e.g. for building cursors.
+
+        Raises:
+            ValueError: If a listed column does not exist.
+        """
+        from_schema = isinstance(projection, type) and issubclass(projection, BaseModel)
+        names = list(projection.model_fields) if from_schema else list(projection)
+        names += [name for name in required if name not in names]
+        column_names = inspect(cls.ModelClass).column_attrs.keys()
+
+        columns, joins = [], []
+        for name in names:
+            if name in cls.RELATED_FIELDS:
+                relationship_name, column_name = cls.RELATED_FIELDS[name]
+                relationship = getattr(cls.ModelClass, relationship_name)
+                related_model = relationship.property.mapper.class_
+                columns.append(getattr(related_model, column_name).label(name))
+                if relationship not in joins:
+                    joins.append(relationship)
+            elif name in column_names:
+                columns.append(getattr(cls.ModelClass, name))
+            elif not from_schema:
+                raise ValueError(f"Invalid column name '{name}' for projection")
+
+        query = select(*columns).select_from(cls.ModelClass)
+        for relationship in joins:
+            query = query.outerjoin(relationship)
+        return query
+
+    @classmethod
+    def _filter_conditions(cls, filters: Dict[str, any]) -> List:
+        """``filter_by`` equivalent that stays on the model when other tables are joined."""
+        return [getattr(cls.ModelClass, key) == value for key, value in filters.items()]
+
+    @classmethod
+    def _apply_search(
+        cls, query, search: Optional[str], search_columns: Optional[List[str]] = None
+    ):
+        """
+        Filter ``query`` to rows matching ``search`` in any of ``search_columns``.
+
+        A row matches when a column contains the term (case-insensitive) or is
+        trigram-similar to it, which tolerates typos. Both predicates are served
+        by the pg_trgm GIN indexes on the searchable columns.
+
+        Args:
+            query: Select statement to filter.
+            search (Optional[str]): Search term; nothing is applied when empty.
+            search_columns (Optional[List[str]]): Columns to search in, defaults
+                to ``SEARCHABLE_COLUMNS``.
+
+        Returns:
+            Tuple: The filtered query and a similarity expression to rank by,
+            or ``None`` when no search was applied.
+
+        Raises:
+            ValueError: If a column is not in ``SEARCHABLE_COLUMNS``.
+        """
+        search = search.strip() if search else None
+        if not search:
+            return query, None
+
+        columns = []
+        for column_name in search_columns or cls.SEARCHABLE_COLUMNS:
+            if column_name not in cls.SEARCHABLE_COLUMNS:
+                raise ValueError(f"Column '{column_name}' is not searchable")
+            columns.append(getattr(cls.ModelClass, column_name))
+        if not columns:
+            return query, None
+
+        pattern = f"%{escape_like(search)}%"
+        conditions = []
+        for column in columns:
+            conditions.append(column.ilike(pattern, escape="\\"))
+            conditions.append(column.op("%")(search))
+        query = query.filter(or_(*conditions))
+
+        similarities = [func.similarity(column, search) for column in columns]
+        rank = similarities[0] if len(similarities) == 1 else func.greatest(*similarities)
+        return query, rank
 
     @classmethod
-    async def delete_all(cls, db: Session, **kwargs):
+    async def _get_keyset_page(
+        cls,
+        db: AsyncSession,
+        query,
+        count_query,
+        cursor: str,
+        page_size: Optional[int],
+        order_by: Optional[List[Tuple[str, bool]]],
+        concurrent_count: bool,
+        rows: bool = False,
+    ):
+        """
+        Fetch one page by seeking past the last row of the previous page.
+
+        The ordering always ends with the primary key so that every row has a
+        unique position, and the cursor carries the ordering values of the last
+        row returned. Postgres can then start reading the index right after that
+        row instead of scanning and discarding ``OFFSET`` rows.
+        """
+        page_size = page_size or DEFAULT_CURSOR_PAGE_SIZE
+        order_by = list(order_by or [("created_at", True)])
+        if not any(column_name == "uuid" for column_name, _ in order_by):
+            order_by.append(("uuid", order_by[-1][1]))
+
+        columns = []
+        for column_name, _ in order_by:
+            column = getattr(cls.ModelClass, column_name, None)
+            if column is None:
+                raise ValueError(f"Invalid column name '{column_name}' for sorting")
+            columns.append(column)
+
+        if cursor:
+            values = decode_cursor(
+                cursor, [column.type.python_type for column in columns]
+            )
+            query = query.filter(cls._seek_condition(columns, order_by, values))
+
+        query = query.order_by(
+            *[
+                desc(column) if is_descending else asc(column)
+                for column, (_, is_descending) in zip(columns, order_by)
+            ]
+        ).limit(page_size + 1)
+
+        if concurrent_count:
+            total_count, result = await asyncio.gather(
+                cls._count(count_query), db.execute(query)
+            )
+        else:
+            total_count = (await db.execute(count_query)).scalar_one()
+            result = await db.execute(query)
+        data = result.all() if rows else result.scalars().all()
+
+        next_cursor = None
+        if len(data) > page_size:
+            data = data[:page_size]
+            next_cursor = encode_cursor(
+                [getattr(data[-1], column_name) for column_name, _ in order_by]
+            )
+
+        pagination_details = PaginationDetails(
+            page_size=page_size,
+            total_records=total_count,
+            total_pages=ceil(total_count / page_size) if total_count > 0 else 1,
+            cursor=cursor,
+            next_cursor=next_cursor,
+        )
+        return data, pagination_details
+
+    @staticmethod
+    def _seek_condition(columns, order_by: List[Tuple[str, bool]], values: List):
+        """Build the ``WHERE`` clause selecting rows that sort after ``values``."""
+        directions = {is_descending for _, is_descending in order_by}
+        if len(directions) == 1:
+            # A single row comparison lets Postgres use a composite index directly.
+            if directions.pop():
+                return tuple_(*columns) < tuple_(*values)
+            return tuple_(*columns) > tuple_(*values)
+
+        # Mixed directions: (a > x) OR (a = x AND b < y) OR ...
+        conditions = []
+        for index, (column, (_, is_descending)) in enumerate(zip(columns, order_by)):
+            preceding = [columns[i] == values[i] for i in range(index)]
+            step = column < values[index] if is_descending else column > values[index]
+            conditions.append(and_(*preceding, step))
+        return or_(*conditions)
+
+    @classmethod
+    async def _count(cls, count_query) -> int:
+        """Run a count query on its own session so it can overlap with other queries."""
+        db = cls.get_db()
         try:
-            query = delete(cls.ModelClass)
-            if kwargs:
-                query = query.filter_by(**kwargs)
-            db.execute(query)
-            db.commit()
+            result = await db.execute(count_query)
+            return result.scalar_one()
         finally:
-            db.close()
+            await db.close()
+
+    @classmethod
+    async def update_all(cls, db: AsyncSession, data: Dict[str, any], **kwargs):
+        query = update(cls.ModelClass).values(data)
+        if kwargs:
+            query = query.filter_by(**kwargs)
+        await db.execute(query)
+
+    @classmethod
+    async def delete(cls, db: AsyncSession, instance: BaseModel):
+        await db.delete(instance)
+        await db.flush()
+
+    @classmethod
+    async def delete_all(cls, db: AsyncSession, **kwargs):
+        query = delete(cls.ModelClass)
+        if kwargs:
+            query = query.filter_by(**kwargs)
+        await db.execute(query)
@@ -0,0 +1,6 @@
+from .base import BaseRepository
+from app.models.contacts import Contact
+
+
+class ContactRepository(BaseRepository):
+    ModelClass = Contact
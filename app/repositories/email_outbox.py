@@ -0,0 +1,40 @@
+from typing import Dict, List
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .base import BaseRepository
+from app.common.enums import EmailStatus
+from app.models.email_outbox import EmailOutbox
+
+
+class EmailOutboxRepository(BaseRepository):
+    ModelClass = EmailOutbox
+
+    @classmethod
+    async def claim_batch(cls, db: AsyncSession, limit: int) -> List[EmailOutbox]:
+        """
+        Lock up to ``limit`` pending emails that are due for delivery.
+
+        Rows already locked by another worker are skipped, so several workers
+        can drain the outbox concurrently. The locks live in the caller's
+        transaction, which must stay open until the rows have been updated.
+        """
+        query = (
+            select(EmailOutbox)
+            .where(
+                EmailOutbox.status == EmailStatus.PENDING.value,
+                EmailOutbox.next_attempt_at <= func.now(),
+            )
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(query)
+        return list(result.scalars().all())
+
+    @classmethod
+    async def count_by_status(cls, db: AsyncSession) -> Dict[str, int]:
+        query = select(EmailOutbox.status, func.count()).group_by(EmailOutbox.status)
+        result = await db.execute(query)
+        return {status: count for status, count in result.all()}
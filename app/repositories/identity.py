@@ -0,0 +1,39 @@
+from typing import Optional, Union
+
+from sqlalchemy import exists, select
+from sqlalchemy.orm import joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .base import BaseRepository
+from app.models.identity import Identity
+from app.models.organisation import Organisation
+from app.models.user import User
+
+
+class IdentityRepository(BaseRepository):
+    ModelClass = Identity
+
+    @staticmethod
+    def normalize_email(email: str) -> str:
+        return email.strip().lower()
+
+    @classmethod
+    async def resolve(
+        cls, db: AsyncSession, email: str
+    ) -> Optional[Union[User, Organisation]]:
+        """Load the user or organisation owning ``email`` in a single query."""
+        query = (
+            select(Identity)
+            .options(joinedload(Identity.user), joinedload(Identity.organisation))
+            .where(Identity.email == cls.normalize_email(email))
+        )
+        identity = (await db.execute(query)).scalars().one_or_none()
+        if identity is None:
+            return None
+        return identity.user or identity.organisation
+
+    @classmethod
+    async def email_exists(cls, db: AsyncSession, email: str) -> bool:
+        """Whether ``email`` is taken by any user or organisation, ignoring case."""
+        query = select(exists().where(Identity.email == cls.normalize_email(email)))
+        return (await db.execute(query)).scalar()
@@ -1,56 +1,47 @@
 import uuid
 from .base import BaseRepository
 from app.models.user import User
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import select  # type: ignore
 from typing import Optional
 
 
 class UserRepository(BaseRepository):
     ModelClass = User
+    SEARCHABLE_COLUMNS = ("first_name", "last_name", "email")
+    RELATED_FIELDS = {"role_name": ("role", "name")}
 
     @classmethod
-    async def get_by_user_id(cls, user_id: uuid) -> Optional[User]:
-        db = cls.get_db()
-        try:
-            query = select(cls.ModelClass).filter_by(uuid=user_id)
-            result = db.execute(query)
-            return result.scalars().one_or_none()
-        finally:
-            db.close()
+    async def get_by_user_id(cls, db: AsyncSession, user_id: uuid) -> Optional[User]:
+        query = select(cls.ModelClass).filter_by(uuid=user_id)
+        result = await db.execute(query)
+        return result.scalars().one_or_none()
 
     @classmethod
     async def get_by_oauth_id_and_provider(
-        cls, oauth_id: str, oauth_provider: str
+        cls, db: AsyncSession, oauth_id: str, oauth_provider: str
     ) -> Optional[User]:
-        db = cls.get_db()
-        try:
-            query = select(cls.ModelClass).filter_by(
-                oauth_id=oauth_id, oauth_provider=oauth_provider
-            )
-            result = db.execute(query)
-            return result.scalars().one_or_none()
-        finally:
-            db.close()
+        query = select(cls.ModelClass).filter_by(
+            oauth_id=oauth_id, oauth_provider=oauth_provider
+        )
+        result = await db.execute(query)
+        return result.scalars().one_or_none()
 
     @classmethod
-    async def update(cls, user_id: uuid, data: dict) -> Optional[User]:
-        db = cls.get_db()
-        try:
-            # Find the user
-            query = select(cls.ModelClass).filter_by(uuid=user_id)
-            result = db.execute(query)
-            user = result.scalars().one_or_none()
+    async def update(cls, db: AsyncSession, user_id: uuid, data: dict) -> Optional[User]:
+        # Find the user
+        query = select(cls.ModelClass).filter_by(uuid=user_id)
+        result = await db.execute(query)
+        user = result.scalars().one_or_none()
 
-            if user:
-                # Update fields
-                for key, value in data.items():
-                    setattr(user, key, value)
+        if user:
+            # Update fields
+            for key, value in data.items():
+                setattr(user, key, value)
 
-                # Commit and refresh
-                db.commit()
-                db.refresh(user)
-                return user
-            else:
-                return None
-        finally:
-            db.close()
+            # Flush and refresh
+            await db.flush()
+            await db.refresh(user)
+            return user
+        else:
+            return None
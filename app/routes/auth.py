@@ -16,6 +16,7 @@ from app.schemas.auth import (
 )
 from app.services.auth import AuthService
 from app.api.response import APIResponse
+from app.core.security import public
 
 router = APIRouter(tags=["Authentication"])
 
@@ -28,6 +29,7 @@ router = APIRouter(tags=["Authentication"])
         409: {"description": "User with provided email address already exists."},
     },
 )
+@public
 async def individual_registration(
     payload: IndividualRegistration, service: AuthService = Depends(AuthService)
 ):
@@ -45,6 +47,7 @@ async def individual_registration(
         409: {"description": "User with provided email address already exists."},
     },
 )
+@public
 async def company_registration(
     payload: OrganisationRegistration, service: AuthService = Depends(AuthService)
 ):
@@ -62,6 +65,7 @@ async def company_registration(
         401: {"description": "Invalid credentials."},
     },
 )
+@public
 async def login(
     request: Request, payload: Login, service: AuthService = Depends(AuthService)
 ) -> AccessJWT:
@@ -85,6 +89,7 @@ async def change_password(payload: ChangePassword, service: AuthService = Depend
         401: {"description": "Invalid credentials."},
     },
 )
+@public
 async def request_password_reset(
     payload: RequestResetPassword, service: AuthService = Depends(AuthService)
 ):
@@ -100,6 +105,7 @@ async def request_password_reset(
         401: {"description": "Invalid credentials."},
     },
 )
+@public
 async def reset_password(
     payload: ResetPassword, service: AuthService = Depends(AuthService)
 ):
@@ -115,6 +121,7 @@ async def reset_password(
         401: {"description": "Invalid credentials."},
     },
 )
+@public
 async def send_password_reset_otp(
     payload: RequestResetPassword, service: AuthService = Depends(AuthService)
 ):
@@ -130,6 +137,7 @@ async def send_password_reset_otp(
         401: {"description": "Invalid credentials."},
     },
 )
+@public
 async def verify_otp_reset_password(
     payload: OTPResetPassword, service: AuthService = Depends(AuthService)
 ):
@@ -148,6 +156,7 @@ async def verify_otp_reset_password(
 
 
 @router.post("/oauth/callback", status_code=200)
+@public
 async def oauth_callback(
     request: Request,
     payload: OAuthCallbackPayload,
@@ -164,6 +173,7 @@ async def oauth_callback(
         401: {"description": "Invalid or expired tokens."},
     },
 )
+@public
 async def refresh_token(
     token_request: TokenRefreshRequest, service: AuthService = Depends(AuthService)
 ) -> AccessJWT:
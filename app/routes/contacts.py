@@ -1,18 +1,20 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any
 from uuid import UUID
 
 from app.schemas.contacts import ContactCreate
 from app.config.pg_database import get_db
 from app.services.contacts import ContactService
-from app.schemas.contacts import ContactResponse, ContactUpdate
+from app.schemas.contacts import ContactExportResponse, ContactResponse, ContactUpdate
+from app.api.export import export_response
+from app.common.enums import ExportFormat
 
 router = APIRouter(tags=["Contacts"])
 
 
 @router.post("/contacts", response_model=ContactResponse)
-async def create_contact(contact: ContactCreate, db: Session = Depends(get_db)):
+async def create_contact(contact: ContactCreate, db: AsyncSession = Depends(get_db)):
     try:
         db_contact = await ContactService.create_contact(db, contact)
         return ContactResponse.from_orm(db_contact)
@@ -24,8 +26,21 @@ async def create_contact(contact: ContactCreate, db: Session = Depends(get_db)):
         )
 
 
+# Declared before ``/contacts/{contact_id}`` so "export" is not read as an id
+@router.get("/contacts/export")
+async def export_contacts(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+):
+    return await export_response(
+        ContactExportResponse,
+        ContactService.export_contacts(),
+        export_format,
+        filename="contacts",
+    )
+
+
 @router.get("/contacts/{contact_id}", response_model=ContactResponse)
-async def get_contact(contact_id: UUID, db: Session = Depends(get_db)):
+async def get_contact(contact_id: UUID, db: AsyncSession = Depends(get_db)):
     try:
         contact = await ContactService.get_contact(db, contact_id)
         if not contact:
@@ -39,7 +54,7 @@ async def get_contact(contact_id: UUID, db: Session = Depends(get_db)):
 
 @router.patch("/contacts/{contact_id}", response_model=ContactResponse)
 async def update_contact(
-    contact_id: UUID, contact_data: ContactUpdate, db: Session = Depends(get_db)
+    contact_id: UUID, contact_data: ContactUpdate, db: AsyncSession = Depends(get_db)
 ):
     try:
         updated_contact = await ContactService.update_contact(
@@ -57,7 +72,7 @@ async def update_contact(
 
 
 @router.delete("/contacts/{contact_id}", response_model=Dict[str, Any])
-async def delete_contact(contact_id: UUID, db: Session = Depends(get_db)):
+async def delete_contact(contact_id: UUID, db: AsyncSession = Depends(get_db)):
     try:
         deleted = await ContactService.delete_contact(db, contact_id)
         if not deleted:
@@ -1,10 +1,12 @@
 import uuid
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Query, Request
 from fastapi.params import Depends
 from starlette import status
 
-from app.schemas.organisation import UpdateOrganisation
+from app.common.enums import ExportFormat
+from app.schemas.organisation import GetOrganisationResponse, UpdateOrganisation
 from app.services.organisation import OrganisationService
+from app.api.export import export_response
 from app.api.response import APIResponse
 
 router = APIRouter(tags=["Organisation"])
@@ -47,6 +49,21 @@ async def get_organisation_list(
     )
 
 
+@router.get("/organisations/export", status_code=status.HTTP_200_OK)
+async def export_organisations(
+    request: Request,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    service: OrganisationService = Depends(OrganisationService),
+):
+    return await export_response(
+        GetOrganisationResponse,
+        service.export_organisations(),
+        export_format,
+        filename="organisations",
+        request=request,
+    )
+
+
 @router.delete("/organisation/{org_id}", status_code=status.HTTP_200_OK)
 async def delete_organisation(
     org_id: uuid.UUID, service: OrganisationService = Depends(OrganisationService)
@@ -25,9 +25,10 @@ async def get_all_permissions(
         search_str: str = None,
         page: int = None,
         page_size: int = None,
+        cursor: str = None,
         service: PermissionService = Depends(PermissionService)
 ):
-    response_data = await service.get_all_permissions(search_str=search_str, page=page, page_size=page_size)
+    response_data = await service.get_all_permissions(search_str=search_str, page=page, page_size=page_size, cursor=cursor)
     return APIResponse.success(message="Successfully get list of all permissions", data=response_data)
 
 
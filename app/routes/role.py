@@ -34,8 +34,9 @@ async def get_all_roles(
         search_str: str = None,
         page: int = None,
         page_size: int = None,
+        cursor: str = None,
         service: RoleService = Depends(RoleService)):
-    response_data = await service.get_all_roles(search_str=search_str, page=page, page_size=page_size)
+    response_data = await service.get_all_roles(search_str=search_str, page=page, page_size=page_size, cursor=cursor)
     return APIResponse.success(message="Successfully get list of all roles", data=response_data)
 
 
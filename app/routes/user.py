@@ -1,14 +1,17 @@
 import uuid
 from typing import Optional, Union
 
-from fastapi import APIRouter, UploadFile, File, Request, Depends
+from fastapi import APIRouter, UploadFile, File, Request, Depends, Query
 from starlette import status
 
 from app.middlewares.jwt_auth import JWTBearerSecurity
+from app.common.enums import ExportFormat
 from app.schemas.user import (
+    GetIndividualUserResponse,
     UpdateIndividualUser,
 )
 from app.services.user import UserService
+from app.api.export import export_response
 from app.api.response import APIResponse
 
 router = APIRouter(tags=["User"])
@@ -34,6 +37,22 @@ async def get_user_list(request: Request, service: UserService = Depends(UserSer
     )
 
 
+@router.get("/users/export", status_code=status.HTTP_200_OK)
+async def export_users(
+    request: Request,
+    search_str: str = None,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    service: UserService = Depends(UserService),
+):
+    return await export_response(
+        GetIndividualUserResponse,
+        service.export_users(search_str=search_str),
+        export_format,
+        filename="users",
+        request=request,
+    )
+
+
 @router.get(
     "/user_roles",
     status_code=status.HTTP_200_OK,
@@ -43,8 +62,9 @@ async def get_user_roles(
         search_str: str = None,
         page: int = None,
         page_size: int = None,
+        cursor: str = None,
         service: UserService = Depends(UserService)):
-    response_data = await service.get_user_roles(request, search_str=search_str, page=page, page_size=page_size)
+    response_data = await service.get_user_roles(request, search_str=search_str, page=page, page_size=page_size, cursor=cursor)
     return APIResponse.success(
         message="User with roles successfully fetched.", data=response_data
     )
@@ -1,3 +1,4 @@
+from datetime import date
 from typing import Optional
 from pydantic import BaseModel, EmailStr, Field, SecretStr, constr, ConfigDict, field_validator
 
@@ -125,6 +126,10 @@ class IndividualRegistrationResponse(BaseModel):
 
     @classmethod
     def from_orm(cls, user_orm):
+        date_of_birth = user_orm.date_of_birth
+        if isinstance(date_of_birth, date):
+            date_of_birth = date_of_birth.isoformat()
+
         return cls(
             uuid=str(user_orm.uuid),
             first_name=user_orm.first_name,
@@ -133,7 +138,7 @@ class IndividualRegistrationResponse(BaseModel):
             email=user_orm.email,
             cell_phone_number_1=user_orm.cell_phone_number_1,
             gender=user_orm.gender,
-            date_of_birth=user_orm.date_of_birth,
+            date_of_birth=date_of_birth,
             country_code=user_orm.country_code,
             country_code_str=user_orm.country_code_str,
         )
@@ -0,0 +1,78 @@
+# Shared field types and bulk conversion for response schemas.
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Annotated, Any, Iterable, List, Optional, Type, TypeVar
+
+from fastapi import Request
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    TypeAdapter,
+    ValidationInfo,
+)
+
+from app.common.utils import format_timestamp
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+def _to_timestamp(value: Any) -> Any:
+    if isinstance(value, datetime):
+        # Same output as ``format_timestamp`` without the cost of strftime.
+        return value.isoformat(sep=" ", timespec="seconds")[:19]
+    if value is None:
+        return format_timestamp(value)
+    return value
+
+
+def _to_iso_date(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+# ``str`` fields filled from UUID, timestamp and date columns; values that are
+# already strings pass through unchanged.
+UUIDStr = Annotated[str, BeforeValidator(str)]
+Timestamp = Annotated[str, BeforeValidator(_to_timestamp)]
+ISODate = Annotated[Optional[str], BeforeValidator(_to_iso_date)]
+
+
+def media_url(path: Optional[str], info: ValidationInfo) -> Optional[str]:
+    """Prefix a stored media path with the request's base URL, if one is in the context."""
+    if not path:
+        return None
+    base_url = (info.context or {}).get("base_url")
+    if not base_url or path.startswith(("http://", "https://")):
+        return path
+    return f"{base_url}{path}"
+
+
+# Stored profile picture path, returned as an absolute URL
+MediaURL = Annotated[Optional[str], AfterValidator(media_url)]
+
+
+def request_context(request: Optional[Request]) -> Optional[dict]:
+    """Validation context carrying the request's base URL for ``MediaURL`` fields."""
+    return {"base_url": str(request.base_url)} if request is not None else None
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type[SchemaT]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+def validate_list(
+    schema: Type[SchemaT], rows: Iterable[Any], request: Optional[Request] = None
+) -> List[SchemaT]:
+    """
+    Convert a whole result set to ``schema`` in a single validation call.
+
+    ``rows`` may be ORM objects or SQLAlchemy rows of plain columns; fields
+    are read by attribute. The request's base URL is passed to validators
+    through the validation context, see ``MediaURL``.
+    """
+    return _list_adapter(schema).validate_python(
+        rows, from_attributes=True, context=request_context(request)
+    )
@@ -1,8 +1,10 @@
 from typing import Optional, Dict, List
 from datetime import datetime
-from pydantic import BaseModel, Field, HttpUrl, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, EmailStr
 from uuid import UUID
 
+from app.schemas.base import Timestamp, UUIDStr
+
 
 class GroupBase(BaseModel):
     name: str
@@ -154,6 +156,26 @@ class ContactResponse(BaseModel):
         from_attributes = True
 
 
+class ContactExportResponse(BaseModel):
+    """Flat contact row for the export endpoints; related records are not included."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    uuid: UUIDStr
+    title: Optional[str] = None
+    first_name: Optional[str] = None
+    middle_name: Optional[str] = None
+    last_name: Optional[str] = None
+    country: Optional[str] = None
+    country_of_stay: Optional[str] = None
+    personal_email: Optional[str] = None
+    personal_mobile: Optional[str] = None
+    birthday: Optional[datetime] = None
+    bio: Optional[str] = None
+    created_at: Timestamp
+    updated_at: Timestamp
+
+
 class SocialAccountsUpdate(BaseModel):
     personal_website: Optional[HttpUrl] = None
     linkedin: Optional[HttpUrl] = None
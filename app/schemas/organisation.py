@@ -1,10 +1,10 @@
 from app.common.enums import UserType
 from fastapi import Request
-from typing import Optional, Any
-from pydantic import BaseModel, EmailStr, Field, constr, ConfigDict
+from typing import Annotated, Optional, Any
+from pydantic import BaseModel, BeforeValidator, EmailStr, Field, constr, ConfigDict
 from sqlalchemy.dialects.postgresql import Range
 
-from app.common.utils import format_timestamp
+from app.schemas.base import MediaURL, Timestamp, UUIDStr, request_context
 
 
 class UpdateOrganisation(BaseModel):
@@ -20,51 +20,32 @@ class UpdateOrganisation(BaseModel):
     password: Optional[str] = Field(None, min_length=8, max_length=20)
 
 
+def _employee_range(value: Any) -> Any:
+    """``[lower, upper]`` with an inclusive upper bound; ``None`` when unbounded."""
+    if value and isinstance(value, Range):
+        upper = value.upper - 1 if value.upper else None
+        return [value.lower, upper]
+    return value
+
+
 class GetOrganisationResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
-    uuid: str
+    uuid: UUIDStr
     organisation_name: str
     ceo_first_name: str
     ceo_last_name: str
-    email: EmailStr
-    user_type: int
+    # Validated when stored; re-validating every row on output is costly.
+    email: str
+    user_type: int = UserType.ORGANISATION.value
     established_year: int
     country: str
-    no_of_employee: Any
+    no_of_employee: Annotated[Any, BeforeValidator(_employee_range)]
     website_link: str
     linkedin: str
-    profile_picture: Optional[str]
-    created_at: Optional[str]
+    profile_picture: MediaURL
+    created_at: Timestamp
 
     @classmethod
     def from_orm(cls, request: Request, org_orm):
-        no_of_employee_value = org_orm.no_of_employee
-        if no_of_employee_value and isinstance(org_orm.no_of_employee, Range):
-            if org_orm.no_of_employee.upper:
-                no_of_employee_value = [
-                    org_orm.no_of_employee.lower,
-                    org_orm.no_of_employee.upper - 1,
-                ]
-            else:
-                no_of_employee_value = [org_orm.no_of_employee.lower, None]
-
-        profile_picture = None
-        if org_orm.profile_picture:
-            profile_picture = f"{request.base_url}{org_orm.profile_picture}"
-
-        return cls(
-            uuid=str(org_orm.uuid),
-            organisation_name=org_orm.organisation_name,
-            ceo_first_name=org_orm.ceo_first_name,
-            ceo_last_name=org_orm.ceo_last_name,
-            email=org_orm.email,
-            user_type=UserType.ORGANISATION.value,
-            established_year=org_orm.established_year,
-            country=org_orm.country,
-            no_of_employee=no_of_employee_value,
-            website_link=org_orm.website_link,
-            linkedin=org_orm.linkedin,
-            profile_picture=profile_picture,
-            created_at=format_timestamp(org_orm.created_at),
-        )
+        return cls.model_validate(org_orm, context=request_context(request))
@@ -1,14 +1,16 @@
 from pydantic import BaseModel
-from typing import List, TypeVar, Generic
+from typing import List, Optional, TypeVar, Generic
 
 T = TypeVar("T", bound=BaseModel)
 
 
 class PaginationDetails(BaseModel):
-    current_page: int
+    current_page: Optional[int] = None
     page_size: int
     total_records: int
     total_pages: int
+    cursor: Optional[str] = None
+    next_cursor: Optional[str] = None
 
 
 class PaginatedResponse(Generic[T], BaseModel):
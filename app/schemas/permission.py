@@ -3,6 +3,7 @@ from uuid import UUID
 from typing import Optional, List
 
 from app.common.utils import format_timestamp
+from app.schemas.base import Timestamp, UUIDStr
 from app.schemas.role import RoleResponse
 
 
@@ -30,21 +31,15 @@ class BulkAssignRoles(BaseModel):
 class PermissionResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
-    uuid: str
+    uuid: UUIDStr
     name: str
     scope: str
     description: Optional[str]
-    created_at: str
+    created_at: Timestamp
 
     @classmethod
     def from_orm(cls, permission_orm):
-        return cls(
-            uuid=str(permission_orm.uuid),
-            name=permission_orm.name,
-            scope=permission_orm.scope,
-            created_at=format_timestamp(permission_orm.created_at),
-            description=permission_orm.description,
-        )
+        return cls.model_validate(permission_orm)
 
 
 class PermissionRolesResponse(BaseModel):
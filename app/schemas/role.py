@@ -1,8 +1,8 @@
 from fastapi import Request
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, ValidationInfo
+from typing import Annotated, Optional, List
 
-from app.common.utils import format_timestamp
+from app.schemas.base import Timestamp, UUIDStr, media_url, request_context
 
 
 class CreateRole(BaseModel):
@@ -16,19 +16,16 @@ class UpdateRole(BaseModel):
 
 
 class RoleResponse(BaseModel):
-    uuid: str
+    model_config = ConfigDict(from_attributes=True)
+
+    uuid: UUIDStr
     name: str
     description: Optional[str]
-    created_at: str
+    created_at: Timestamp
 
     @classmethod
     def from_orm(cls, role_orm):
-        return cls(
-            uuid=str(role_orm.uuid),
-            name=role_orm.name,
-            description=role_orm.description,
-            created_at=format_timestamp(role_orm.created_at),
-        )
+        return cls.model_validate(role_orm)
 
 class DeleteRoleResponse(BaseModel):
     uuid: str
@@ -40,28 +37,30 @@ class DeleteRoleResponse(BaseModel):
         )
 
 
+def _profile_picture_urls(paths: Optional[List[str]], info: ValidationInfo) -> List[str]:
+    urls = [media_url(path, info) for path in paths or [] if path]
+    return urls[:2]
+
+
 class UsersRoleResponse(BaseModel):
-    uuid: str
+    model_config = ConfigDict(from_attributes=True)
+
+    uuid: UUIDStr
     name: str
     user_count: int
-    profile_picture: Optional[List[str]]
+    # Up to two profile pictures of users holding the role
+    profile_picture: Annotated[
+        Optional[List[str]], AfterValidator(_profile_picture_urls)
+    ]
 
     @classmethod
     def from_orm(cls, role_orm, request: Request, user_count: int, profile_picture: list[str] = []):
-        profile_pictures = []
-        if profile_picture != []:
-            for profile_pic in profile_picture:
-                if profile_pic and profile_pic != "" and "https" not in profile_pic:
-                    profile_pictures.append(f"{request.base_url}{profile_pic}")
-                elif "https" in profile_pic:
-                    profile_pictures.append(profile_pic)
-                else:
-                    continue
-
-        return cls(
-            uuid=str(role_orm.uuid),
-            name=role_orm.name,
-            description=role_orm.description,
-            user_count=user_count,
-            profile_picture=profile_pictures[:2],
-        )
\ No newline at end of file
+        return cls.model_validate(
+            {
+                "uuid": role_orm.uuid,
+                "name": role_orm.name,
+                "user_count": user_count,
+                "profile_picture": profile_picture,
+            },
+            context=request_context(request),
+        )
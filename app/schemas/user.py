@@ -1,10 +1,9 @@
 # User-related schemas for data validation and serialization.
 from fastapi import Request
-from datetime import date
 from typing import Optional, List
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import AliasChoices, AliasPath, BaseModel, EmailStr, Field, ConfigDict
 
-from app.common.utils import format_timestamp
+from app.schemas.base import ISODate, MediaURL, Timestamp, UUIDStr, request_context
 
 
 class UpdateIndividualUser(BaseModel):
@@ -26,95 +25,55 @@ class UpdateIndividualUser(BaseModel):
 class GetIndividualUserResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
-    uuid: str
+    uuid: UUIDStr
     first_name: str
     last_name: str
     organisation_name: Optional[str]
-    email: Optional[EmailStr | None]
+    # Validated when stored; re-validating every row on output is costly.
+    email: Optional[str]
     country_code: Optional[str | None]
     cell_phone_number_1: Optional[str | None]
     gender: int
     user_type: Optional[int]
-    date_of_birth: Optional[str | None]
-    created_at: Optional[str]
+    date_of_birth: ISODate
+    created_at: Timestamp
     bio: Optional[str]
-    profile_picture: Optional[str]
+    profile_picture: MediaURL
     address: Optional[str]
     country_code_str: Optional[str]
     designation: Optional[str]
-    languages: Optional[List[dict]]
+    # Not read from the ORM object (that would lazy-load the relationship),
+    # see ``from_orm``.
+    languages: Optional[List[dict]] = Field(None, validation_alias="language_names")
 
     @classmethod
     def from_orm(
         cls, user_orm, request: Request, language_names: Optional[List[dict]] = None
     ):
-        date_of_birth = user_orm.date_of_birth
-        if isinstance(date_of_birth, date):
-            date_of_birth = date_of_birth.isoformat()
-
-        profile_picture = None
-        if user_orm.profile_picture:
-            profile_picture = f"{request.base_url}{user_orm.profile_picture}"
-
-        return cls(
-            uuid=str(user_orm.uuid),
-            first_name=user_orm.first_name,
-            last_name=user_orm.last_name,
-            organisation_name=user_orm.organisation_name,
-            email=user_orm.email,
-            country_code=user_orm.country_code,
-            cell_phone_number_1=user_orm.cell_phone_number_1,
-            gender=user_orm.gender,
-            user_type=user_orm.user_type,
-            date_of_birth=date_of_birth,
-            created_at=format_timestamp(user_orm.created_at),
-            bio=user_orm.bio,
-            profile_picture=profile_picture,
-            address=user_orm.address,
-            country_code_str=user_orm.country_code_str,
-            designation=user_orm.designation,
-            languages=language_names,
-        )
+        user = cls.model_validate(user_orm, context=request_context(request))
+        if language_names is not None:
+            user = user.model_copy(update={"languages": language_names})
+        return user
 
 
 class GetUserRolesResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
-    uuid: str
+    uuid: UUIDStr
     first_name: str
     last_name: str
     organisation_name: Optional[str]
-    email: Optional[EmailStr | None]
+    email: Optional[str]
     cell_phone_number_1: Optional[str | None]
     user_type: Optional[int]
-    date_of_birth: Optional[str | None]
-    created_at: Optional[str]
-    profile_picture: Optional[str]
+    date_of_birth: ISODate
+    created_at: Timestamp
+    profile_picture: MediaURL
     designation: Optional[str]
-    role_name: Optional[str]
+    role_name: Optional[str] = Field(
+        None, validation_alias=AliasChoices("role_name", AliasPath("role", "name"))
+    )
 
     @classmethod
     def from_orm(cls, user_orm, request: Request):
-        date_of_birth = user_orm.date_of_birth
-        if isinstance(date_of_birth, date):
-            date_of_birth = date_of_birth.isoformat()
-
-        profile_picture = None
-        if user_orm.profile_picture:
-            profile_picture = f"{request.base_url}{user_orm.profile_picture}"
-
-        return cls(
-            uuid=str(user_orm.uuid),
-            first_name=user_orm.first_name,
-            last_name=user_orm.last_name,
-            organisation_name=user_orm.organisation_name,
-            email=user_orm.email,
-            cell_phone_number_1=user_orm.cell_phone_number_1,
-            user_type=user_orm.user_type,
-            date_of_birth=date_of_birth,
-            created_at=format_timestamp(user_orm.created_at),
-            bio=user_orm.bio,
-            profile_picture=profile_picture,
-            designation=user_orm.designation,
-            role_name=user_orm.role.name if user_orm.role else None,
-        )
+        return cls.model_validate(user_orm, context=request_context(request))
@@ -1,6 +1,5 @@
 import uuid
 
-import bcrypt
 import httpx
 import json
 import base64
@@ -13,7 +12,9 @@ from jose import jwt, JWTError, ExpiredSignatureError
 from pydantic import SecretStr, EmailStr
 from datetime import datetime, timedelta, date
 from typing import Dict, Any, Optional
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql.ranges import Range
 
 from app.config import settings
@@ -34,7 +35,9 @@ from app.schemas.user import GetIndividualUserResponse
 from app.models.organisation import Organisation
 from app.repositories.user import UserRepository
 from app.repositories.organisation import OrganisationRepository
+from app.repositories.identity import IdentityRepository
 from app.common.errors import (
+    AppError,
     UserAlreadyExistsError,
     OrganisationAlreadyExistsError,
     AuthenticationFailedError,
@@ -42,6 +45,7 @@ from app.common.errors import (
     InvalidTokenError,
     InvalidProviderError,
     InvalidOTPError,
+    ProviderUnavailableError,
     UserNotFoundError,
 )
 from app.models.user import User
@@ -72,24 +76,26 @@ from app.config.settings import (
 )
 from app.api.response import APIResponse
 
-from google.oauth2 import id_token
-from google.auth.transport import requests
-import requests as req
 
 from ..common.context import UserContext
+from ..common.utils import parse_datetime, parse_int_range
+from ..core.hashing import password_hasher
+from ..core.circuit_breaker import provider_call
+from ..core.http import get_http_client, provider_timeout
+from ..core.jwks import apple_jwks, google_jwks
 from ..config.pg_database import get_db
 from ..models.base import BaseModel
 
 
 class AuthService:
-    def __init__(self, db: Session = Depends(get_db)):
+    def __init__(self, db: AsyncSession = Depends(get_db)):
         self.db = db
 
     async def individual_registration(
         self, payload: IndividualRegistration
     ) -> IndividualRegistrationResponse:
-        existing_user = await UserRepository.exists(
-            self.db, email=payload.email
+        existing_user = await IdentityRepository.email_exists(
+            self.db, payload.email
         ) or await UserRepository.exists(
             self.db, cell_phone_number_1=payload.cell_phone_number_1
         )
@@ -98,11 +104,6 @@ class AuthService:
                 message="User already exists with this email or phone number"
             )
 
-        if await OrganisationRepository.exists(self.db, email=payload.email):
-            raise UserAlreadyExistsError(
-                message="Organisation already exists with this email"
-            )
-
         role_obj = await RoleRepository.get_one(self.db, name="Individual-User")
         if not role_obj:
             role_obj = Role(name="Individual-User", description="Individual")
@@ -117,36 +118,29 @@ class AuthService:
             email=payload.email,
             gender=payload.gender,
             role_id=role_obj.uuid,
-            date_of_birth=payload.date_of_birth,
-            password=self.hash_password(password=payload.password),
+            date_of_birth=parse_datetime(payload.date_of_birth),
+            password=await self.hash_password(password=payload.password),
             user_type=UserType.INDIVIDUAL_USER.value,
             country_code=payload.country_code,
             country_code_str=payload.country_code_str,
             cell_phone_number_1=payload.cell_phone_number_1,
         )
-        await UserRepository.create(self.db, instance=user)
+        try:
+            await UserRepository.create(self.db, instance=user)
+        except IntegrityError:
+            # Lost a race against a concurrent registration with the same email
+            raise UserAlreadyExistsError(
+                message="User already exists with this email or phone number"
+            )
         return IndividualRegistrationResponse.from_orm(user)
 
     async def register_organisation(
         self, payload: OrganisationRegistration
     ) -> OrganisationRegistrationResponse:
-        existing_organisation = await OrganisationRepository.get_one(
-            self.db, email=payload.email
-        )
-        if existing_organisation:
+        if await IdentityRepository.email_exists(self.db, payload.email):
             raise OrganisationAlreadyExistsError
 
-        if await UserRepository.exists(self.db, email=payload.email):
-            raise UserAlreadyExistsError(message="User already exists with this email")
-
-        min_count, max_count = payload.no_of_employee.strip("[]").split(",")
-        min_count = int(min_count)
-        max_count = None if max_count == "" else int(max_count)
-
-        if max_count is None:
-            no_of_employee_range = f"[{min_count},)"
-        else:
-            no_of_employee_range = f"[{min_count},{max_count}]"
+        no_of_employee_range = parse_int_range(payload.no_of_employee)
         organisation = Organisation(
             uuid=uuid.uuid4(),
             organisation_name=payload.organisation_name,
@@ -158,35 +152,36 @@ class AuthService:
             no_of_employee=no_of_employee_range,
             website_link=payload.website_link,
             linkedin=payload.linkedin,
-            password=self.hash_password(payload.password),
+            password=await self.hash_password(payload.password),
         )
 
-        await OrganisationRepository.create(self.db, instance=organisation)
+        try:
+            await OrganisationRepository.create(self.db, instance=organisation)
+        except IntegrityError:
+            raise OrganisationAlreadyExistsError
         return OrganisationRegistrationResponse.from_orm(organisation)
 
     async def login(self, request: Request, payload: Login) -> AccessJWT:
-        user = await UserRepository.get_one(self.db, email=payload.email)
+        user = await IdentityRepository.resolve(self.db, payload.email)
         if not user:
-            user = await OrganisationRepository.get_one(self.db, email=payload.email)
-            if not user:
-                raise AuthenticationFailedError
+            raise AuthenticationFailedError
 
-        self.validate_user_and_password(user=user, password=payload.password)
+        await self.validate_user_and_password(user=user, password=payload.password)
         return self.create_tokens(request=request, user=user, otp_validated=False)
 
     async def change_password(self, payload: ChangePassword):
-        current_user_email = UserContext.get().get("email")
+        current_user_email = UserContext.get().email
         if not current_user_email:
             raise AuthenticationFailedError
 
-        user = await UserRepository.get_one(
-            self.db, email=current_user_email
-        ) or await OrganisationRepository.get_one(self.db, email=current_user_email)
+        user = await IdentityRepository.resolve(self.db, current_user_email)
         if not user:
             raise UserNotFoundError
 
-        self.validate_user_and_password(user=user, password=payload.current_password)
-        hashed_password = self.hash_password(payload.new_password.get_secret_value())
+        await self.validate_user_and_password(
+            user=user, password=payload.current_password, rehash=False
+        )
+        hashed_password = await self.hash_password(payload.new_password.get_secret_value())
         repository = (
             UserRepository if isinstance(user, User) else OrganisationRepository
         )
@@ -195,8 +190,8 @@ class AuthService:
         )
 
     async def get_profile_details(self, request):
-        current_user_email = UserContext.get().get("email")
-        user_type = UserContext.get().get("user_type")
+        current_user_email = UserContext.get().email
+        user_type = UserContext.get().user_type
         if not current_user_email or not user_type:
             raise AuthenticationFailedError
 
@@ -222,16 +217,26 @@ class AuthService:
             )
             return GetOrganisationResponse.from_orm(request, user)
 
-    @staticmethod
-    def validate_user_and_password(user: BaseModel, password: SecretStr):
+    async def validate_user_and_password(
+        self, user: BaseModel, password: SecretStr, rehash: bool = True
+    ):
         raw_password = password.get_secret_value()
         # if not bcrypt.verify(raw_password, user.password):
         #     raise AuthenticationFailedError
-        if not bcrypt.checkpw(
-            raw_password.encode("utf-8"), user.password.encode("utf-8")
-        ):
+        if not await password_hasher.verify(raw_password, user.password):
             raise AuthenticationFailedError
 
+        # Upgrade hashes made with outdated parameters while the password is at hand
+        if rehash and password_hasher.needs_rehash(user.password):
+            hashed_password = await self.hash_password(raw_password)
+            repository = (
+                UserRepository if isinstance(user, User) else OrganisationRepository
+            )
+            await repository.update_all(
+                self.db, {"password": hashed_password}, uuid=user.uuid
+            )
+            user.password = hashed_password
+
     async def handle_token_refresh(
         self, token_request: TokenRefreshRequest
     ) -> AccessJWT:
@@ -492,11 +497,9 @@ class AuthService:
     #     return AccessJWT(access_token=token, token_type=settings.JWT_TYPE)
 
     async def request_password_reset(self, email: str):
-        user = await UserRepository.get_one(self.db, email=email)
+        user = await IdentityRepository.resolve(self.db, email)
         if not user:
-            user = await OrganisationRepository.get_one(self.db, email=email)
-            if not user:
-                raise RecordNotExistsError
+            raise RecordNotExistsError
 
         payload = {"sub": user.email}
         reset_token = self.create_jwt(payload)
@@ -504,7 +507,7 @@ class AuthService:
         reset_link = f"{settings.FRONTEND_URL}/reset-password?token={reset_token}"
         subject = "Password Reset Request"
         body = f"<p>Click on the link to reset your password: {reset_link}</p>"
-        await EmailService.send([user.email], subject, body)
+        await EmailService.enqueue(self.db, [user.email], subject, body)
 
     async def reset_password(self, token: str, new_password: SecretStr):
         try:
@@ -516,13 +519,11 @@ class AuthService:
         except JWTError:
             raise InvalidTokenError
 
-        user = await UserRepository.get_one(self.db, email=email)
+        user = await IdentityRepository.resolve(self.db, email)
         if not user:
-            user = await OrganisationRepository.get_one(self.db, email=email)
-            if not user:
-                raise RecordNotExistsError
+            raise RecordNotExistsError
 
-        hashed_password = self.hash_password(new_password.get_secret_value())
+        hashed_password = await self.hash_password(new_password.get_secret_value())
         if isinstance(user, Organisation):
             await OrganisationRepository.update_all(
                 self.db, data={"password": hashed_password}, uuid=user.uuid
@@ -533,30 +534,26 @@ class AuthService:
             )
 
     async def send_reset_password_otp_mail(self, email: EmailStr):
-        user = await UserRepository.get_one(self.db, email=email)
+        user = await IdentityRepository.resolve(self.db, email)
         if not user:
-            user = await OrganisationRepository.get_one(self.db, email=email)
-            if not user:
-                raise RecordNotExistsError
+            raise RecordNotExistsError
 
         otp = self.generate_otp()
 
         subject = "OTP for Password Reset"
         body = f"<p>Reset password OTP: {otp}</p>"
-        await EmailService.send([user.email], subject, body)
+        await EmailService.enqueue(self.db, [user.email], subject, body)
 
     async def verify_otp_reset_password(self, payload: OTPResetPassword):
         verified_otp = self.verify_otp(payload.otp)
         if not verified_otp:
             raise InvalidOTPError
 
-        user = await UserRepository.get_one(self.db, email=payload.email)
+        user = await IdentityRepository.resolve(self.db, payload.email)
         if not user:
-            user = await OrganisationRepository.get_one(self.db, email=payload.email)
-            if not user:
-                raise RecordNotExistsError
+            raise RecordNotExistsError
 
-        hashed_password = self.hash_password(payload.new_password.get_secret_value())
+        hashed_password = await self.hash_password(payload.new_password.get_secret_value())
         if isinstance(user, Organisation):
             await OrganisationRepository.update_all(
                 self.db, data={"password": hashed_password}, uuid=user.uuid
@@ -567,10 +564,8 @@ class AuthService:
             )
 
     @staticmethod
-    def hash_password(password: str) -> str:
-        salt = bcrypt.gensalt()
-        hashed_password = bcrypt.hashpw(password.encode("utf-8"), salt)
-        return hashed_password.decode("utf-8")
+    async def hash_password(password: str) -> str:
+        return await password_hasher.hash(password)
 
     @staticmethod
     def create_jwt(payload_data: Dict[str, Any]) -> str:
@@ -665,52 +660,53 @@ class AuthService:
                     f"Unsupported OAuth provider: {payload.provider}"
                 )
 
-            if provider_lower == OAuthProvider.TWITTER.value:
-                if not payload.code_verifier:
-                    raise InvalidTokenError(
-                        "code_verifier is required for Twitter OAuth"
+            async with provider_call(provider_lower):
+                if provider_lower == OAuthProvider.TWITTER.value:
+                    if not payload.code_verifier:
+                        raise InvalidTokenError(
+                            "code_verifier is required for Twitter OAuth"
+                        )
+                    tokens = await self.exchange_oauth_code_for_tokens(
+                        code=payload.code,
+                        provider=provider_lower,
+                        redirect_uri=payload.redirect_uri,
+                        code_verifier=payload.code_verifier,
+                        platform=payload.platform,
+                    )
+                else:
+                    tokens = await self.exchange_oauth_code_for_tokens(
+                        code=payload.code,
+                        provider=provider_lower,
+                        redirect_uri=payload.redirect_uri,
+                        code_verifier=None,
+                        platform=payload.platform,
                     )
-                tokens = await self.exchange_oauth_code_for_tokens(
-                    code=payload.code,
-                    provider=provider_lower,
-                    redirect_uri=payload.redirect_uri,
-                    code_verifier=payload.code_verifier,
-                    platform=payload.platform,
-                )
-            else:
-                tokens = await self.exchange_oauth_code_for_tokens(
-                    code=payload.code,
-                    provider=provider_lower,
-                    redirect_uri=payload.redirect_uri,
-                    code_verifier=None,
-                    platform=payload.platform,
-                )
 
-            if provider_lower in [
-                OAuthProvider.LINKEDIN.value,
-                OAuthProvider.FACEBOOK.value,
-                OAuthProvider.TWITTER.value,
-            ]:
-                id_token_str = tokens.get("access_token")
-            else:
-                id_token_str = tokens.get("id_token")
+                if provider_lower in [
+                    OAuthProvider.LINKEDIN.value,
+                    OAuthProvider.FACEBOOK.value,
+                    OAuthProvider.TWITTER.value,
+                ]:
+                    id_token_str = tokens.get("access_token")
+                else:
+                    id_token_str = tokens.get("id_token")
 
-            if not id_token_str:
-                raise InvalidTokenError(
-                    "ID token not found in the response from the provider"
-                )
+                if not id_token_str:
+                    raise InvalidTokenError(
+                        "ID token not found in the response from the provider"
+                    )
 
-            if provider_lower == OAuthProvider.YAHOO.value:
-                decoded_data_from_id_token = await self.decode_oauth_id_token(
-                    id_token_str,
-                    provider_lower,
-                    tokens.get("access_token"),
-                    payload.platform,
-                )
-            else:
-                decoded_data_from_id_token = await self.decode_oauth_id_token(
-                    id_token_str, provider_lower, None, payload.platform
-                )
+                if provider_lower == OAuthProvider.YAHOO.value:
+                    decoded_data_from_id_token = await self.decode_oauth_id_token(
+                        id_token_str,
+                        provider_lower,
+                        tokens.get("access_token"),
+                        payload.platform,
+                    )
+                else:
+                    decoded_data_from_id_token = await self.decode_oauth_id_token(
+                        id_token_str, provider_lower, None, payload.platform
+                    )
 
             decoded_data_from_id_token.update(
                 {"access_token": tokens.get("access_token")}
@@ -757,12 +753,13 @@ class AuthService:
                 picture = decoded_data_from_id_token.get("picture", None)
 
             user = await UserRepository.get_by_oauth_id_and_provider(
-                oauth_id=oauth_id, oauth_provider=payload.provider
+                self.db, oauth_id=oauth_id, oauth_provider=payload.provider
             )
 
             if user:
                 # Create JWT for the newly created or updated user
                 updated_user = await UserRepository.update(
+                    self.db,
                     user_id=user.uuid,
                     data={"oauth_details": json.dumps(decoded_data_from_id_token)},
                 )
@@ -822,6 +819,8 @@ class AuthService:
                 status_code=409,
                 message=f"User already exists: {str(e)}",
             )
+        except ProviderUnavailableError as e:
+            return APIResponse.error(status_code=e.status_code, message=e.message)
         except Exception as ex:
             return APIResponse.error(
                 status_code=500,
@@ -970,35 +969,46 @@ class AuthService:
         else:
             raise InvalidProviderError(f"Unsupported provider: {provider}")
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(token_url, data=data, headers=headers)
-                response_json = response.json()
-                if response.status_code == 200:
-                    return response_json
-                else:
-                    error_description = response_json.get(
-                        "error_description", response_json.get("error", "Unknown error")
-                    )
-                    raise AuthenticationFailedError(
-                        f"Failed to fetch tokens from {provider} provider: {error_description}"
-                    )
-            except httpx.HTTPStatusError as http_err:
-                raise AuthenticationFailedError(
-                    f"HTTP error during token exchange: {http_err}"
-                ) from http_err
-            except httpx.RequestError as req_err:
-                raise AuthenticationFailedError(
-                    f"Request error during token exchange: {req_err}"
-                ) from req_err
-            except ValueError as json_err:
-                raise AuthenticationFailedError(
-                    f"JSON decoding failed during token exchange: {json_err}"
-                ) from json_err
-            except Exception as e:
+        try:
+            response = await get_http_client().post(
+                token_url,
+                data=data,
+                headers=headers,
+                timeout=provider_timeout(provider),
+            )
+            if response.status_code >= 500:
+                raise ProviderUnavailableError(
+                    f"{provider.capitalize()} returned HTTP {response.status_code}, "
+                    "please try again later."
+                )
+            response_json = response.json()
+            if response.status_code == 200:
+                return response_json
+            else:
+                error_description = response_json.get(
+                    "error_description", response_json.get("error", "Unknown error")
+                )
                 raise AuthenticationFailedError(
-                    f"An unexpected error occurred during token exchange: {e}"
-                ) from e
+                    f"Failed to fetch tokens from {provider} provider: {error_description}"
+                )
+        except httpx.HTTPStatusError as http_err:
+            raise AuthenticationFailedError(
+                f"HTTP error during token exchange: {http_err}"
+            ) from http_err
+        except AppError:
+            raise
+        except httpx.RequestError as req_err:
+            raise ProviderUnavailableError(
+                f"Request error during token exchange: {req_err}"
+            ) from req_err
+        except ValueError as json_err:
+            raise AuthenticationFailedError(
+                f"JSON decoding failed during token exchange: {json_err}"
+            ) from json_err
+        except Exception as e:
+            raise AuthenticationFailedError(
+                f"An unexpected error occurred during token exchange: {e}"
+            ) from e
 
     @staticmethod
     async def decode_oauth_id_token(
@@ -1033,57 +1043,59 @@ class AuthService:
 
     @staticmethod
     async def decode_google_data(id_token_str: str, platform):
+        if platform == "web":
+            client_id = GOOGLE_WEB_CLIENT_ID
+        elif platform == "ios":
+            client_id = GOOGLE_IOS_CLIENT_ID
+        else:
+            raise InvalidTokenError(f"Unsupported platform: {platform}")
         try:
-            if platform == "web":
-                decoded_token = id_token.verify_oauth2_token(
-                    id_token_str, requests.Request(), GOOGLE_WEB_CLIENT_ID
-                )
-            elif platform == "ios":
-                decoded_token = id_token.verify_oauth2_token(
-                    id_token_str, requests.Request(), GOOGLE_IOS_CLIENT_ID
-                )
-
-            return decoded_token
-        except ValueError as e:
+            return await google_jwks.verify(id_token_str, audience=client_id)
+        except JWTError as e:
             raise InvalidTokenError(f"Error decoding Google ID token: {e}")
 
     @staticmethod
     async def decode_facebook_data(id_token_str: str):
         user_info_url = "https://graph.facebook.com/me?fields=id,name,email,picture"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                user_info_url, params={"access_token": id_token_str}
+        response = await get_http_client().get(
+            user_info_url,
+            params={"access_token": id_token_str},
+            timeout=provider_timeout(OAuthProvider.FACEBOOK.value),
+        )
+        if response.status_code != 200:
+            raise InvalidTokenError(
+                f"Error fetching Facebook user info: {response.json()}"
             )
-            if response.status_code != 200:
-                raise InvalidTokenError(
-                    f"Error fetching Facebook user info: {response.json()}"
-                )
-            return response.json()
+        return response.json()
 
     @staticmethod
     async def decode_instagram_data(id_token_str: str):
         user_info_url = "https://graph.instagram.com/me?fields=id,username,account_type"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                user_info_url, params={"access_token": id_token_str}
+        response = await get_http_client().get(
+            user_info_url,
+            params={"access_token": id_token_str},
+            timeout=provider_timeout(OAuthProvider.INSTAGRAM.value),
+        )
+        if response.status_code != 200:
+            raise InvalidTokenError(
+                f"Error fetching Instagram user info: {response.json()}"
             )
-            if response.status_code != 200:
-                raise InvalidTokenError(
-                    f"Error fetching Instagram user info: {response.json()}"
-                )
-            return response.json()
+        return response.json()
 
     @staticmethod
     async def decode_linkedin_data(id_token_str: str):
         user_info_url = "https://api.linkedin.com/v2/userinfo"
         headers = {"Authorization": f"Bearer {id_token_str}"}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(user_info_url, headers=headers)
-            if response.status_code != 200:
-                raise InvalidTokenError(
-                    f"Error fetching LinkedIn user info: {response.json()}"
-                )
-            return response.json()
+        response = await get_http_client().get(
+            user_info_url,
+            headers=headers,
+            timeout=provider_timeout(OAuthProvider.LINKEDIN.value),
+        )
+        if response.status_code != 200:
+            raise InvalidTokenError(
+                f"Error fetching LinkedIn user info: {response.json()}"
+            )
+        return response.json()
 
     @staticmethod
     async def decode_yahoo_data(access_token: str, id_token_str: str):
@@ -1091,26 +1103,21 @@ class AuthService:
             f"https://api.login.yahoo.com/openid/v1/userinfo?id_token={id_token_str}"
         )
         headers = {"Authorization": f"Bearer {access_token}"}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(user_info_url, headers=headers)
-            if response.status_code != 200:
-                raise InvalidTokenError(
-                    f"Error fetching Yahoo user info: {response.json()}"
-                )
-            return response.json()
+        response = await get_http_client().get(
+            user_info_url,
+            headers=headers,
+            timeout=provider_timeout(OAuthProvider.YAHOO.value),
+        )
+        if response.status_code != 200:
+            raise InvalidTokenError(
+                f"Error fetching Yahoo user info: {response.json()}"
+            )
+        return response.json()
 
     @staticmethod
     async def decode_apple_data(id_token_str: str):
-        # Apple requires the ID token to be decoded as a JWT
         try:
-            # Replace APPLE_PUBLIC_KEY with your actual Apple public key
-            decoded_token = jwt.decode(
-                id_token_str,
-                APPLE_PUBLIC_KEY,
-                algorithms=["RS256"],
-                audience=APPLE_CLIENT_ID,
-            )
-            return decoded_token
+            return await apple_jwks.verify(id_token_str, audience=APPLE_CLIENT_ID)
         except JWTError as e:
             raise InvalidTokenError(f"Error decoding Apple ID token: {e}")
 
@@ -1122,36 +1129,39 @@ class AuthService:
             "User-Agent": "YourAppNameHere",  # Replace with your actual User-Agent
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(user_info_url, headers=headers)
-                response.raise_for_status()
-                user_data = response.json()
-
-                if "data" not in user_data or "id" not in user_data["data"]:
-                    raise InvalidTokenError(
-                        "Incomplete user information received from Twitter."
-                    )
-
-                return user_data["data"]
+        try:
+            response = await get_http_client().get(
+                user_info_url,
+                headers=headers,
+                timeout=provider_timeout(OAuthProvider.TWITTER.value),
+            )
+            response.raise_for_status()
+            user_data = response.json()
 
-            except httpx.HTTPStatusError as http_err:
-                error_detail = response.json().get("error", response.text)
+            if "data" not in user_data or "id" not in user_data["data"]:
                 raise InvalidTokenError(
-                    f"HTTP error occurred while fetching Twitter user info: {error_detail}"
-                ) from http_err
-            except httpx.RequestError as req_err:
-                raise InvalidTokenError(
-                    f"Request error occurred while fetching Twitter user info: {req_err}"
-                ) from req_err
-            except ValueError as json_err:
-                raise InvalidTokenError(
-                    f"JSON decoding failed for Twitter user info: {json_err}"
-                ) from json_err
-            except Exception as ex:
-                raise InvalidTokenError(
-                    f"An unexpected error occurred while fetching Twitter user info: {ex}"
-                ) from ex
+                    "Incomplete user information received from Twitter."
+                )
+
+            return user_data["data"]
+
+        except httpx.HTTPStatusError as http_err:
+            error_detail = response.json().get("error", response.text)
+            raise InvalidTokenError(
+                f"HTTP error occurred while fetching Twitter user info: {error_detail}"
+            ) from http_err
+        except httpx.RequestError as req_err:
+            raise InvalidTokenError(
+                f"Request error occurred while fetching Twitter user info: {req_err}"
+            ) from req_err
+        except ValueError as json_err:
+            raise InvalidTokenError(
+                f"JSON decoding failed for Twitter user info: {json_err}"
+            ) from json_err
+        except Exception as ex:
+            raise InvalidTokenError(
+                f"An unexpected error occurred while fetching Twitter user info: {ex}"
+            ) from ex
 
     @staticmethod
     async def decode_zoho_data(id_token_str: str):
@@ -1,5 +1,5 @@
 from typing import List, Type, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 from pydantic import BaseModel
 
@@ -11,7 +11,7 @@ from app.common.errors import RecordNotExistsError, RecordAlreadyExistsError
 class BaseService:
     def __init__(
         self,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         repository: Type[BaseRepository] = None,
         response: Type[BaseModel] = None,
     ):
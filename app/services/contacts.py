@@ -1,10 +1,18 @@
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from typing import Optional, Dict, Any
 from pydantic import AnyUrl
 from uuid import UUID
 
-from app.schemas.contacts import ContactCreate, ContactResponse, ContactUpdate
+from app.repositories.contacts import ContactRepository
+from app.schemas.contacts import (
+    ContactCreate,
+    ContactExportResponse,
+    ContactResponse,
+    ContactUpdate,
+)
 from app.models.contacts import (
     Contact,
     SocialAccounts,
@@ -15,20 +23,25 @@ from app.models.contacts import (
 
 class ContactService:
     @staticmethod
-    async def fetch_contact_info(db: Session, contact_uuid: UUID) -> ContactResponse:
+    def export_contacts():
+        """Row batches for the contact export."""
+        return ContactRepository.stream(projection=ContactExportResponse)
+
+    @staticmethod
+    async def fetch_contact_info(db: AsyncSession, contact_uuid: UUID) -> ContactResponse:
         """
         Fetch a contact's information with related nested objects.
         """
-        db_contact = (
-            db.query(Contact)
+        query = (
+            select(Contact)
             .options(
                 selectinload(Contact.social_accounts),
                 selectinload(Contact.meeting_info),
                 selectinload(Contact.additional_information),
             )
             .filter(Contact.uuid == contact_uuid)
-            .first()
         )
+        db_contact = (await db.execute(query)).scalars().first()
 
         if not db_contact:
             raise ValueError("Contact not found")
@@ -57,7 +70,7 @@ class ContactService:
         return ContactResponse(**response_data)
 
     @staticmethod
-    async def create_contact(db: Session, contact: ContactCreate) -> ContactResponse:
+    async def create_contact(db: AsyncSession, contact: ContactCreate) -> ContactResponse:
         """
         Create a new contact and return its detailed information.
         """
@@ -76,8 +89,8 @@ class ContactService:
                 additional_details=contact.additional_details,
             )
             db.add(db_contact)
-            db.commit()
-            db.refresh(db_contact)
+            await db.flush()
+            await db.refresh(db_contact)
 
             social_accounts_data = contact.social_accounts.dict(
                 exclude_unset=True, by_alias=True
@@ -100,19 +113,19 @@ class ContactService:
             )
 
             db.add_all([social_accounts, meeting_info, additional_info])
-            db.commit()
+            await db.flush()
 
             return await ContactService.fetch_contact_info(db, db_contact.uuid)
 
         except IntegrityError:
-            db.rollback()
+            await db.rollback()
             raise ValueError("Email already exists or invalid data provided")
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise Exception(f"Error creating contact: {str(e)}")
 
     @staticmethod
-    async def get_contact(db: Session, contact_id: UUID) -> ContactResponse:
+    async def get_contact(db: AsyncSession, contact_id: UUID) -> ContactResponse:
         """
         Retrieve an existing contact by UUID.
         """
@@ -123,13 +136,22 @@ class ContactService:
 
     @staticmethod
     async def update_contact(
-        db: Session, contact_id: UUID, contact_data: ContactUpdate
+        db: AsyncSession, contact_id: UUID, contact_data: ContactUpdate
     ) -> ContactResponse:
         """
         Update an existing contact with new data and return the updated contact information.
         """
         try:
-            contact = db.query(Contact).filter(Contact.uuid == contact_id).first()
+            query = (
+                select(Contact)
+                .options(
+                    selectinload(Contact.social_accounts),
+                    selectinload(Contact.meeting_info),
+                    selectinload(Contact.additional_information),
+                )
+                .filter(Contact.uuid == contact_id)
+            )
+            contact = (await db.execute(query)).scalars().first()
             if not contact:
                 raise ValueError("Contact not found")
 
@@ -159,48 +181,48 @@ class ContactService:
                     if hasattr(contact.additional_information, key):
                         setattr(contact.additional_information, key, value)
 
-            db.commit()
+            await db.flush()
 
             return await ContactService.fetch_contact_info(db, contact_id)
 
         except IntegrityError:
-            db.rollback()
+            await db.rollback()
             raise ValueError("Invalid data provided for update")
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise Exception(f"Error updating contact: {str(e)}")
 
     @staticmethod
-    async def delete_contact(db: Session, contact_id: UUID) -> bool:
+    async def delete_contact(db: AsyncSession, contact_id: UUID) -> bool:
         """
         Delete a contact and all related information in other tables.
         """
-        contact = (
-            db.query(Contact)
+        query = (
+            select(Contact)
             .options(
                 selectinload(Contact.social_accounts),
                 selectinload(Contact.meeting_info),
                 selectinload(Contact.additional_information),
             )
             .filter(Contact.uuid == contact_id)
-            .first()
         )
+        contact = (await db.execute(query)).scalars().first()
 
         if not contact:
             return False
 
         try:
             if contact.social_accounts:
-                db.delete(contact.social_accounts)
+                await db.delete(contact.social_accounts)
             if contact.meeting_info:
-                db.delete(contact.meeting_info)
+                await db.delete(contact.meeting_info)
             if contact.additional_information:
-                db.delete(contact.additional_information)
+                await db.delete(contact.additional_information)
 
-            db.delete(contact)
-            db.commit()
+            await db.delete(contact)
+            await db.flush()
             return True
 
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise Exception(f"Error deleting contact: {str(e)}")
@@ -1,25 +1,168 @@
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-import aiosmtplib
+from typing import Dict, Optional
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.enums import EmailStatus
 from app.config import settings
+from app.config.pg_database import AsyncSessionLocal, on_commit
+from app.core.smtp import smtp_pool
+from app.models.email_outbox import EmailOutbox
+from app.repositories.email_outbox import EmailOutboxRepository
+
+logger = logging.getLogger(__name__)
 
 
 class EmailService:
     @staticmethod
-    async def send(recipient_emails: list[str], subject: str, body: str):
+    def build_message(recipient_emails: list[str], subject: str, body: str):
         html_message = MIMEMultipart("alternative")
         html_message["Subject"] = subject
         html_message["From"] = settings.SENDER_EMAIL
         html_message["To"] = ", ".join(recipient_emails)
 
         html_message.attach(MIMEText(body, "html"))
+        return html_message
 
-        server = aiosmtplib.SMTP(hostname="smtp.gmail.com", port=465, use_tls=True)
-        await server.connect(
-            username=settings.SENDER_EMAIL, password=settings.SENDER_PASSWORD
-        )
-        await server.sendmail(
-            settings.SENDER_EMAIL, recipient_emails, html_message.as_string()
+    @staticmethod
+    async def send(recipient_emails: list[str], subject: str, body: str):
+        """Send immediately; request handlers should use ``enqueue`` instead."""
+        await smtp_pool.send(
+            EmailService.build_message(recipient_emails, subject, body)
         )
-        await server.quit()
+
+    @staticmethod
+    async def enqueue(
+        db: AsyncSession, recipient_emails: list[str], subject: str, body: str
+    ):
+        """Store the email in the outbox; the worker delivers it once the request commits."""
+        email = EmailOutbox(recipients=recipient_emails, subject=subject, body=body)
+        await EmailOutboxRepository.create(db, instance=email)
+        on_commit(db, email_outbox_worker.notify)
+        return email
+
+
+class EmailOutboxWorker:
+    """
+    Delivers outbox emails in the background.
+
+    Each round locks a batch of due emails (``FOR UPDATE SKIP LOCKED``, so
+    several app processes can run workers side by side), sends them over the
+    pooled SMTP connections and records the outcome in the same transaction.
+    Failed emails are retried with exponential backoff and marked dead after
+    ``max_attempts``. The worker sleeps for ``poll_interval`` when the outbox
+    is drained, or until ``notify`` reports a new email.
+    """
+
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        batch_size: int = settings.EMAIL_OUTBOX_BATCH_SIZE,
+        poll_interval: float = settings.EMAIL_OUTBOX_POLL_SECONDS,
+        max_attempts: int = settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+        backoff: float = settings.EMAIL_OUTBOX_BACKOFF_SECONDS,
+        max_backoff: float = settings.EMAIL_OUTBOX_BACKOFF_MAX_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.metrics: Counter = Counter()
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 10):
+        """Let the current batch finish, then stop; cancels it after ``timeout``."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        self._stopping = True
+        self.notify()
+        try:
+            await asyncio.wait_for(task, timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Email outbox worker cancelled mid-batch on shutdown")
+
+    def notify(self):
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                delivered = await self.drain_once()
+            except Exception:
+                logger.exception("Email outbox round failed")
+                delivered = 0
+            if delivered < self.batch_size and not self._stopping:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+
+    async def drain_once(self) -> int:
+        """Process one batch of due emails; returns how many were attempted."""
+        async with self.session_factory() as db:
+            async with db.begin():
+                emails = await EmailOutboxRepository.claim_batch(db, self.batch_size)
+                for email in emails:
+                    await self._deliver(email)
+        if emails:
+            self.metrics["batches"] += 1
+        return len(emails)
+
+    async def _deliver(self, email: EmailOutbox):
+        email.attempts += 1
+        try:
+            await EmailService.send(email.recipients, email.subject, email.body)
+        except Exception as e:
+            email.last_error = f"{type(e).__name__}: {e}"[:1000]
+            self.metrics["failed_attempts"] += 1
+            if email.attempts >= self.max_attempts:
+                email.status = EmailStatus.DEAD.value
+                self.metrics[EmailStatus.DEAD.value] += 1
+                logger.error(
+                    "Giving up on email %s after %s attempts: %s",
+                    email.uuid,
+                    email.attempts,
+                    email.last_error,
+                )
+            else:
+                email.next_attempt_at = datetime.now(timezone.utc) + timedelta(
+                    seconds=self.retry_delay(email.attempts)
+                )
+                self.metrics["retried"] += 1
+        else:
+            email.status = EmailStatus.SENT.value
+            email.sent_at = datetime.now(timezone.utc)
+            email.last_error = None
+            self.metrics[EmailStatus.SENT.value] += 1
+
+    def retry_delay(self, attempts: int) -> float:
+        return min(self.backoff * 2 ** (attempts - 1), self.max_backoff)
+
+    async def status_counts(self) -> Dict[str, int]:
+        """Number of outbox rows per status, across all workers."""
+        async with self.session_factory() as db:
+            return await EmailOutboxRepository.count_by_status(db)
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self.metrics)
+
+
+email_outbox_worker = EmailOutboxWorker()
@@ -1,5 +1,5 @@
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base import BaseService
 from app.schemas.language import LanguageResponse, UserLanguageResponse
@@ -8,12 +8,12 @@ from ..config.pg_database import get_db
 
 
 class LanguageService(BaseService):
-    def __init__(self, db: Session = Depends(get_db)):
+    def __init__(self, db: AsyncSession = Depends(get_db)):
         repository = LanguageRepository
         super().__init__(db=db, repository=repository, response=LanguageResponse)
 
 
 class UserLanguageService(BaseService):
-    def __init__(self, db: Session = Depends(get_db)):
+    def __init__(self, db: AsyncSession = Depends(get_db)):
         repository = UserLanguageRepository
         super().__init__(db=db, repository=repository, response=UserLanguageResponse)
@@ -2,17 +2,19 @@ import uuid
 from urllib.request import Request
 
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.organisation import OrganisationRepository
+from app.repositories.identity import IdentityRepository
 from app.schemas.organisation import UpdateOrganisation, GetOrganisationResponse
 from app.services.auth import AuthService
 from app.common.errors import OrganisationNotFoundError, OrganisationAlreadyExistsError
+from ..common.utils import parse_int_range
 from ..config.pg_database import get_db
 
 
 class OrganisationService:
-    def __init__(self, db: Session = Depends(get_db)):
+    def __init__(self, db: AsyncSession = Depends(get_db)):
         self.db = db
 
     async def get_organisation_list(self, request: Request):
@@ -22,6 +24,10 @@ class OrganisationService:
 
         return [GetOrganisationResponse.from_orm(request, org) for org in orgs]
 
+    def export_organisations(self):
+        """Row batches for the organisation export."""
+        return OrganisationRepository.stream(projection=GetOrganisationResponse)
+
     async def update_organisation_by_id(
         self, request: Request, org_id: uuid.UUID, payload: UpdateOrganisation
     ):
@@ -29,9 +35,9 @@ class OrganisationService:
         if not user:
             raise OrganisationNotFoundError
 
-        if payload.email and payload.email != user.email:
-            existing_user = await OrganisationRepository.exists(
-                self.db, email=payload.email
+        if payload.email and payload.email.lower() != (user.email or "").lower():
+            existing_user = await IdentityRepository.email_exists(
+                self.db, payload.email
             )
             if existing_user:
                 raise OrganisationAlreadyExistsError(
@@ -41,7 +47,9 @@ class OrganisationService:
         update_data = payload.dict(exclude_unset=True)
         password = update_data.get("password")
         if password:
-            update_data["password"] = AuthService.hash_password(password)
+            update_data["password"] = await AuthService.hash_password(password)
+        if update_data.get("no_of_employee"):
+            update_data["no_of_employee"] = parse_int_range(update_data["no_of_employee"])
         await OrganisationRepository.update_all(self.db, data=update_data, uuid=org_id)
 
         updated_org = await OrganisationRepository.get_one(self.db, uuid=org_id)
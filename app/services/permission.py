@@ -1,7 +1,7 @@
-from typing import List
+from typing import FrozenSet, List
 
 from app.common.enums import UserType
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, HTTPException, status
 
 from app.repositories.permission import PermissionRepository
@@ -14,14 +14,16 @@ from app.schemas.permission import (
     BulkAssignRoles,
     DeletePermissionResponse
 )
+from app.common.cache import CACHE_MISS, permission_cache
 from app.common.errors import RecordNotExistsError, RecordAlreadyExistsError
-from ..config.pg_database import get_db
+from ..config.pg_database import get_db, on_commit
 from ..config.settings import ORGANISATION_ROLE
+from ..schemas.base import validate_list
 from ..schemas.pagination import PaginatedResponse
 
 
 class PermissionService:
-    def __init__(self, db: Session = Depends(get_db)):
+    def __init__(self, db: AsyncSession = Depends(get_db)):
         self.db = db
 
     async def create_permission(self, payload: CreatePermission):
@@ -46,20 +48,24 @@ class PermissionService:
         await PermissionRepository.create(self.db, instance=permission)
         return PermissionResponse.from_orm(permission)
 
-    async def get_all_permissions(self, search_str: str = None, page: int = None, page_size: int = None):
+    async def get_all_permissions(
+            self, search_str: str = None, page: int = None, page_size: int = None, cursor: str = None
+    ):
         permissions, pagination_details = await PermissionRepository.get_paginated(
             self.db,
             order_by=[('created_at', True)],
             search=search_str,
             search_columns=['name', 'description'],
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor,
+            projection=PermissionResponse,
         )
         if not permissions:
             raise RecordNotExistsError
 
         return PaginatedResponse(
-            data=[PermissionResponse.from_orm(permission) for permission in permissions],
+            data=validate_list(PermissionResponse, permissions),
             pagination=pagination_details
         )
 
@@ -79,7 +85,10 @@ class PermissionService:
         await PermissionRepository.update_all(
             self.db, data=update_data, uuid=permission_id
         )
-        permission_obj = await PermissionRepository.get_permission_with_roles(uuid=permission_id)
+        on_commit(self.db, permission_cache.invalidate_roles)
+        permission_obj = await PermissionRepository.get_permission_with_roles(
+            self.db, uuid=permission_id
+        )
         return PermissionRolesResponse.from_orm(permission_obj).dict()
 
     async def delete_permission(self, permission_id: str):
@@ -88,11 +97,11 @@ class PermissionService:
             raise RecordNotExistsError(f"Permission with ID {permission_id} not found.")
 
         await PermissionRepository.delete(self.db, instance=permission)
+        on_commit(self.db, permission_cache.invalidate_roles)
         return DeletePermissionResponse.from_orm(permission)
 
-    @staticmethod
-    async def get_permission_roles():
-        permissions = await PermissionRepository.get_permissions_with_roles()
+    async def get_permission_roles(self):
+        permissions = await PermissionRepository.get_permissions_with_roles(self.db)
         if not permissions:
             raise RecordNotExistsError
         return [
@@ -103,12 +112,12 @@ class PermissionService:
         response_data = []
         for update in payload:
             permission = await PermissionRepository.get_permission_with_roles(
-                uuid=update.permission_id
+                self.db, uuid=update.permission_id
             )
             if not permission:
                 continue
 
-            permission = self.db.merge(permission)
+            roles_to_add, roles_to_remove = [], []
             if update.roles_to_add:
                 roles_to_add = await PermissionRepository.get_roles_by_uuid_list(
                     self.db, update.roles_to_add
@@ -126,12 +135,24 @@ class PermissionService:
                         permission.roles.remove(role)
 
             await PermissionRepository.save_permission(self.db, permission)
+            on_commit(
+                self.db,
+                permission_cache.invalidate_roles,
+                [role.name for role in [*roles_to_add, *roles_to_remove]],
+            )
             response_data.append(PermissionRolesResponse.from_orm(permission))
         return response_data
 
-    async def get_user_permissions(self, entity_id: str, entity_type: int) -> List[str]:
+    async def get_user_permissions(self, entity_id: str, entity_type: int) -> FrozenSet[str]:
+        role = await self.get_entity_role(entity_id, entity_type)
+        return await self.get_role_permissions(role)
+
+    async def get_entity_role(self, entity_id: str, entity_type: int) -> str:
         if entity_type == UserType.INDIVIDUAL_USER.value:
-            role = await PermissionRepository.get_user_role(self.db, entity_id)
+            role = permission_cache.get_user_role(entity_id)
+            if role is CACHE_MISS:
+                role = await PermissionRepository.get_user_role(self.db, entity_id)
+                permission_cache.set_user_role(entity_id, role)
         elif entity_type == UserType.ORGANISATION.value:
             role = ORGANISATION_ROLE
         else:
@@ -142,7 +163,13 @@ class PermissionService:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="User role not found."
             )
-        permission_names = await PermissionRepository.get_permissions_by_role(
-            self.db, role
-        )
+        return role
+
+    async def get_role_permissions(self, role: str) -> FrozenSet[str]:
+        permission_names = permission_cache.get_role_permissions(role)
+        if permission_names is CACHE_MISS:
+            permission_names = frozenset(
+                await PermissionRepository.get_permissions_by_role(self.db, role)
+            )
+            permission_cache.set_role_permissions(role, permission_names)
         return permission_names
@@ -2,22 +2,24 @@ from typing import List
 
 from app.repositories.user import UserRepository
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.role import CreateRole, UpdateRole, RoleResponse, UsersRoleResponse, DeleteRoleResponse
+from app.schemas.base import validate_list
 from app.schemas.pagination import PaginatedResponse
 from app.repositories.role import RoleRepository, RolePermissionRepository
+from app.common.cache import permission_cache
 from app.common.errors import (
     RecordAlreadyExistsError,
     RecordNotExistsError,
     RoleAssignedToUserError, RoleAssignedToPermissionError
 )
 from app.models.role import Role
-from ..config.pg_database import get_db
+from ..config.pg_database import get_db, on_commit
 
 
 class RoleService:
-    def __init__(self, db: Session = Depends(get_db)):
+    def __init__(self, db: AsyncSession = Depends(get_db)):
         self.db = db
 
     async def create_role(self, payload: CreateRole):
@@ -30,18 +32,22 @@ class RoleService:
         return RoleResponse.from_orm(role)
 
 
-    async def get_all_roles(self, search_str: str = None, page: int = None, page_size: int = None) -> PaginatedResponse:
+    async def get_all_roles(
+            self, search_str: str = None, page: int = None, page_size: int = None, cursor: str = None
+    ) -> PaginatedResponse:
         roles, pagination_details = await RoleRepository.get_paginated(
             self.db,
             order_by=[('created_at', True)],
             search=search_str,
             search_columns=['name', 'description'],
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor,
+            projection=RoleResponse,
         )
 
         return PaginatedResponse(
-            data=[RoleResponse.from_orm(role) for role in roles],
+            data=validate_list(RoleResponse, roles),
             pagination=pagination_details
         )
 
@@ -49,12 +55,7 @@ class RoleService:
         users_role = await RoleRepository.get_all_with_user_count(self.db)
         if not users_role:
             raise RecordNotExistsError
-        return [
-            UsersRoleResponse.from_orm(
-                role, request=request, user_count=count, profile_picture=profile_picture
-            )
-            for role, count, profile_picture in users_role
-        ]
+        return validate_list(UsersRoleResponse, users_role, request)
 
     # async def get_all_users_with_role(self, search_str: str = None, page: int = None, page_size: int = None) -> List[RoleResponse]:
     #     roles = await RoleRepository.get_all(
@@ -83,6 +84,8 @@ class RoleService:
         }
 
         await RoleRepository.update_all(self.db, data=update_data, uuid=role_id)
+        # Users are cached by role name, so a rename invalidates both maps
+        on_commit(self.db, permission_cache.clear)
         updated_role = await RoleRepository.get_one(self.db, uuid=role_id)
         return RoleResponse.from_orm(updated_role)
 
@@ -100,4 +103,5 @@ class RoleService:
             raise RoleAssignedToPermissionError
 
         await RoleRepository.delete(self.db, instance=role)
+        on_commit(self.db, permission_cache.clear)
         return DeleteRoleResponse.from_orm(role)
@@ -2,10 +2,12 @@ import os
 import uuid
 from typing import Optional
 from fastapi import Depends, UploadFile, Request
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.user import UserRepository
 from app.repositories.organisation import OrganisationRepository
+from app.repositories.identity import IdentityRepository
 from app.schemas.user import (
     GetUserRolesResponse,
     UpdateIndividualUser,
@@ -15,11 +17,14 @@ from app.services.auth import AuthService
 from app.models.user import User
 from app.common.errors import UserNotFoundError, UserAlreadyExistsError
 from .language import UserLanguageService
+from ..common.cache import permission_cache
 from ..common.context import UserContext
-from ..config.pg_database import get_db
+from ..common.utils import parse_datetime
+from ..config.pg_database import get_db, on_commit
 from ..config.settings import PROFILE_PICTURE_DIR
 from ..models.language import UserLanguage
 from ..schemas.language import CreateUserLanguage
+from ..schemas.base import validate_list
 from ..schemas.pagination import PaginatedResponse
 
 
@@ -28,7 +33,7 @@ from ..schemas.pagination import PaginatedResponse
 
 
 class UserService:
-    def __init__(self, db: Session = Depends(get_db)):
+    def __init__(self, db: AsyncSession = Depends(get_db)):
         self.db = db
 
     async def update_user_by_id(
@@ -39,8 +44,8 @@ class UserService:
         if not user:
             raise UserNotFoundError
 
-        if payload.email and payload.email != user.email:
-            existing_user = await UserRepository.exists(self.db, email=payload.email)
+        if payload.email and payload.email.lower() != (user.email or "").lower():
+            existing_user = await IdentityRepository.email_exists(self.db, payload.email)
             if existing_user:
                 raise UserAlreadyExistsError(
                     message="User already exists with this email"
@@ -62,7 +67,9 @@ class UserService:
         password = update_data.get("password")
         languages = update_data.get("languages")
         if password:
-            update_data["password"] = AuthService.hash_password(password)
+            update_data["password"] = await AuthService.hash_password(password)
+        if "date_of_birth" in update_data:
+            update_data["date_of_birth"] = parse_datetime(update_data["date_of_birth"])
         if languages:
             for language in languages:
                 if not await user_language_service.get_one(
@@ -74,6 +81,7 @@ class UserService:
                     await user_language_service.create(payload=user_language_obj)
             del update_data["languages"]
         await UserRepository.update_all(self.db, data=update_data, uuid=user_id)
+        on_commit(self.db, permission_cache.invalidate_user, user_id)
 
         updated_user = await UserRepository.get_one(self.db, uuid=user_id)
         return GetIndividualUserResponse.from_orm(updated_user, request)
@@ -81,12 +89,11 @@ class UserService:
     async def update_profile_picture(
         self, request: Request, profile_picture: Optional[UploadFile] = None
     ):
-        email = UserContext.get().get("email")
-        user = await UserRepository.get_one(self.db, email=email)
-        repository = UserRepository if user else OrganisationRepository
-        user = user or await OrganisationRepository.get_one(self.db, email=email)
+        email = UserContext.get().email
+        user = await IdentityRepository.resolve(self.db, email)
         if not user:
             raise UserNotFoundError
+        repository = UserRepository if isinstance(user, User) else OrganisationRepository
 
         if not os.path.exists(PROFILE_PICTURE_DIR):
             os.makedirs(PROFILE_PICTURE_DIR)
@@ -107,25 +114,36 @@ class UserService:
         return {"file_path": public_url}
 
     async def get_user_list(self, request):
-        users = await UserRepository.get_all(self.db)
+        users = await UserRepository.get_all(
+            self.db, projection=GetIndividualUserResponse
+        )
         if not users:
             raise UserNotFoundError
 
-        return [GetIndividualUserResponse.from_orm(user, request) for user in users]
+        return validate_list(GetIndividualUserResponse, users, request)
+
+    def export_users(self, search_str: Optional[str] = None):
+        """Row batches for the user export, filtered like ``get_user_roles``."""
+        return UserRepository.stream(
+            projection=GetIndividualUserResponse,
+            search=search_str,
+            search_columns=["first_name", "last_name", "email"],
+        )
 
-    async def get_user_roles(self, request, search_str, page, page_size):
+    async def get_user_roles(self, request, search_str, page, page_size, cursor=None):
         # users = await UserRepository.get_all(self.db, include_role=True)
         # if not users:
         #     raise UserNotFoundError
 
         users, pagination_details = await UserRepository.get_paginated(
-            self.db, include_role=True, search=search_str, search_columns=["first_name", "last_name", "email"],
-            page=page, page_size=page_size)
+            self.db, search=search_str, search_columns=["first_name", "last_name", "email"],
+            page=page, page_size=page_size, concurrent_count=True, cursor=cursor,
+            projection=GetUserRolesResponse)
         if not users:
             raise UserNotFoundError
 
         return PaginatedResponse(
-            data=[GetUserRolesResponse.from_orm(user, request) for user in users],
+            data=validate_list(GetUserRolesResponse, users, request),
             pagination=pagination_details
         )
 
@@ -135,6 +153,7 @@ class UserService:
             raise UserNotFoundError
 
         await UserRepository.delete(self.db, instance=user)
+        on_commit(self.db, permission_cache.invalidate_user, user_id)
 
     async def delete_user_by_email(self, email: str):
         user = await UserRepository.get_one(self.db, email=email)
@@ -142,6 +161,7 @@ class UserService:
             raise UserNotFoundError
 
         await UserRepository.delete(self.db, instance=user)
+        on_commit(self.db, permission_cache.invalidate_user, user.uuid)
 
     async def get_user_by_email(self, request: Request, email: str):
         user = await UserRepository.get_one(self.db, email=email)
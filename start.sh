@@ -19,6 +19,8 @@ print_help () {
   echo "    $0 lint"
   echo "To reformat code:"
   echo "    $0 reformat"
+  echo "To calibrate the password hashing cost for this host:"
+  echo "    $0 calibrate-hashing"
   echo ""
 }
 
@@ -50,6 +52,11 @@ while [ $# -gt 0 ]; do
       set +x
       shift
       ;;
+    calibrate-hashing )  ## Benchmark bcrypt and record the cost to use
+      maybe_install
+      pipenv run python -m app.core.hashing
+      shift
+      ;;
     help )  ## Describe the commands available in this script
       print_help
       shift
@@ -1,14 +1,15 @@
 import os
 import uuid
 import pytest
+import pytest_asyncio
 import hashlib
 from dotenv import load_dotenv
 from fastapi.testclient import TestClient
 
 
 from app.main import app
-from app.config.pg_test_database import get_test_db
-from app.config.pg_database import get_db
+from app.config.pg_test_database import get_test_db, TestSessionLocal
+from app.config.pg_database import get_db, unit_of_work
 from app.schemas.auth import IndividualRegistration
 from app.services.auth import AuthService
 from app.services.organisation import OrganisationService
@@ -23,9 +24,11 @@ def client():
     return TestClient(app)
 
 
-@pytest.fixture
-def database():
-    return next(get_test_db())
+@pytest_asyncio.fixture
+async def database():
+    # One unit of work per test, like a request: committed at teardown.
+    async with unit_of_work(TestSessionLocal) as db:
+        yield db
 
 
 def current_test() -> str:
@@ -8,10 +8,11 @@ from dotenv import load_dotenv
 
 from fastapi.testclient import TestClient
 import pytest
+import pytest_asyncio
 
 from app.main import app
-from app.config.pg_database import get_db
-from app.config.pg_test_database import get_test_db
+from app.config.pg_database import get_db, unit_of_work
+from app.config.pg_test_database import get_test_db, TestSessionLocal
 from app.schemas.auth import IndividualRegistration, OrganisationRegistration
 from app.services.auth import AuthService
 from app.services.organisation import OrganisationService
@@ -27,9 +28,11 @@ load_dotenv()
 app.dependency_overrides[get_db] = get_test_db
 
 
-@pytest.fixture
-def database():
-    return next(get_db())
+@pytest_asyncio.fixture
+async def database():
+    # One unit of work per test, like a request: committed at teardown.
+    async with unit_of_work(TestSessionLocal) as db:
+        yield db
 
 
 def current_test() -> str:
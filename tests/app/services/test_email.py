@@ -0,0 +1,105 @@
+import socket
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.config import settings
+from app.core.smtp import SMTPConnectionPool
+from app.services.email import EmailService
+
+
+class RecordingHandler:
+    """Stand-in SMTP server that keeps every message it accepts."""
+
+    def __init__(self, fail_first: int = 0):
+        self.messages = []
+        self.sessions = set()
+        self.fail_first = fail_first
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.fail_first:
+            self.fail_first -= 1
+            return "421 Service not available, closing transmission channel"
+        self.sessions.add(id(session))
+        self.messages.append(envelope)
+        return "250 Message accepted for delivery"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    monkeypatch.setattr(settings, "SENDER_EMAIL", "noreply@example.com")
+
+    def start(handler):
+        controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+        controller.start()
+        started.append(controller)
+        return controller
+
+    started = []
+    yield start
+    for controller in started:
+        controller.stop()
+
+
+def make_pool(controller, **kwargs) -> SMTPConnectionPool:
+    return SMTPConnectionPool(
+        hostname=controller.hostname, port=controller.port, use_tls=False, **kwargs
+    )
+
+
+def message(index: int):
+    return EmailService.build_message(
+        [f"user{index}@example.com"], f"Subject {index}", f"<p>Body {index}</p>"
+    )
+
+
+class TestSMTPConnectionPool:
+    @pytest.mark.asyncio
+    async def test_should_reuse_one_connection_for_many_messages(self, smtp_server):
+        handler = RecordingHandler()
+        pool = make_pool(smtp_server(handler), size=2)
+
+        await pool.send(message(0))
+        await pool.send_many([message(1), message(2)])
+        await pool.close()
+
+        assert [envelope.rcpt_tos for envelope in handler.messages] == [
+            ["user0@example.com"],
+            ["user1@example.com"],
+            ["user2@example.com"],
+        ]
+        assert len(handler.sessions) == 1
+        assert pool.stats()["connects"] == 1
+        assert pool.stats()["sent"] == 3
+
+    @pytest.mark.asyncio
+    async def test_should_reconnect_when_server_closes_connection(self, smtp_server):
+        handler = RecordingHandler(fail_first=1)
+        pool = make_pool(smtp_server(handler))
+
+        await pool.send(message(0))
+        await pool.close()
+
+        assert len(handler.messages) == 1
+        assert pool.stats()["connects"] == 2
+        assert pool.stats()["reconnects"] == 1
+
+    @pytest.mark.asyncio
+    async def test_should_replace_idle_and_retired_connections(self, smtp_server):
+        handler = RecordingHandler()
+        pool = make_pool(smtp_server(handler), max_messages=2)
+
+        await pool.send_many([message(0), message(1)])
+        await pool.send(message(2))
+        pool.idle_timeout = 0
+        await pool.send(message(3))
+        await pool.close()
+
+        assert len(handler.messages) == 4
+        assert pool.stats()["connects"] == 3
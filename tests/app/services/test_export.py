@@ -0,0 +1,97 @@
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects.postgresql import Range
+
+from app.api.export import export_response
+from app.common.enums import ExportFormat
+from app.schemas.organisation import GetOrganisationResponse
+
+
+def organisation(index: int):
+    return SimpleNamespace(
+        uuid=f"00000000-0000-0000-0000-00000000000{index}",
+        organisation_name=f"Org {index}",
+        ceo_first_name="Ada",
+        ceo_last_name="Lovelace",
+        email=f"org{index}@example.com",
+        established_year=2000 + index,
+        country="UK",
+        no_of_employee=Range(1, 11),
+        website_link="https://example.com",
+        linkedin="https://linkedin.com/in/org, ltd",
+        profile_picture=None,
+        created_at=datetime(2024, 1, 2, 3, 4, 5),
+    )
+
+
+class RowBatches:
+    """Async row batches that record how far they were consumed."""
+
+    def __init__(self, *batches):
+        self.batches = list(batches)
+        self.fetched = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.fetched == len(self.batches):
+            raise StopAsyncIteration
+        self.fetched += 1
+        return self.batches[self.fetched - 1]
+
+    async def aclose(self):
+        self.closed = True
+
+
+async def read_body(response) -> str:
+    return b"".join([chunk async for chunk in response.body_iterator]).decode()
+
+
+class TestExportResponse:
+    @pytest.mark.asyncio
+    async def test_should_stream_ndjson_batch_by_batch(self):
+        batches = RowBatches([organisation(0), organisation(1)], [organisation(2)])
+
+        response = await export_response(
+            GetOrganisationResponse, batches, ExportFormat.NDJSON, "organisations"
+        )
+        # Only the first batch is fetched before the body is streamed
+        assert batches.fetched == 1
+        body = await read_body(response)
+
+        rows = [json.loads(line) for line in body.splitlines()]
+        assert [row["organisation_name"] for row in rows] == ["Org 0", "Org 1", "Org 2"]
+        assert rows[0]["no_of_employee"] == [1, 10]
+        assert rows[0]["created_at"] == "2024-01-02 03:04:05"
+        assert response.media_type == "application/x-ndjson"
+        assert batches.closed
+
+    @pytest.mark.asyncio
+    async def test_should_stream_csv_with_header(self):
+        batches = RowBatches([organisation(0)])
+
+        response = await export_response(
+            GetOrganisationResponse, batches, ExportFormat.CSV, "organisations"
+        )
+        lines = (await read_body(response)).splitlines()
+
+        assert lines[0].split(",") == list(GetOrganisationResponse.model_fields)
+        assert '"[1,10]"' in lines[1]
+        assert '"https://linkedin.com/in/org, ltd"' in lines[1]
+        assert len(lines) == 2
+        assert 'filename="organisations.csv"' in response.headers["content-disposition"]
+
+    @pytest.mark.asyncio
+    async def test_should_write_only_the_header_when_nothing_matches(self):
+        response = await export_response(
+            GetOrganisationResponse, RowBatches(), ExportFormat.CSV, "organisations"
+        )
+
+        assert (await read_body(response)).splitlines() == [
+            ",".join(GetOrganisationResponse.model_fields)
+        ]
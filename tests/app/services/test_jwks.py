@@ -0,0 +1,113 @@
+import time
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt, JWTError
+
+from app.core.jwks import JWKSCache
+
+ISSUER = "https://accounts.google.com"
+AUDIENCE = "test-client-id"
+
+
+def generate_signing_key(kid: str):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_jwk = jwk.construct(private_pem, "RS256").public_key().to_dict()
+    public_jwk.update(kid=kid, use="sig")
+    return private_pem, public_jwk
+
+
+def sign(private_pem, kid: str, **claims):
+    now = int(time.time())
+    payload = {
+        "iss": ISSUER,
+        "aud": AUDIENCE,
+        "sub": "1234567890",
+        "email": "jwks@example.com",
+        "iat": now,
+        "exp": now + 300,
+        "at_hash": "not-checked",
+        **claims,
+    }
+    return jwt.encode(payload, private_pem, algorithm="RS256", headers={"kid": kid})
+
+
+class TestJWKSCache:
+    @pytest.mark.asyncio
+    async def test_should_verify_token_with_seeded_keys(self):
+        private_pem, public_jwk = generate_signing_key("key-1")
+        cache = JWKSCache("Test", "https://keys.invalid/certs", issuers=[ISSUER])
+        cache.seed({"keys": [public_jwk]}, max_age=3600)
+
+        claims = await cache.verify(sign(private_pem, "key-1"), audience=AUDIENCE)
+
+        assert claims["email"] == "jwks@example.com"
+        assert cache.fetches == 0
+
+    @pytest.mark.asyncio
+    async def test_should_reject_wrong_audience_and_issuer(self):
+        private_pem, public_jwk = generate_signing_key("key-1")
+        cache = JWKSCache("Test", "https://keys.invalid/certs", issuers=[ISSUER])
+        cache.seed({"keys": [public_jwk]}, max_age=3600)
+
+        with pytest.raises(JWTError):
+            await cache.verify(sign(private_pem, "key-1"), audience="other-client")
+        with pytest.raises(JWTError):
+            await cache.verify(
+                sign(private_pem, "key-1", iss="https://evil.example"),
+                audience=AUDIENCE,
+            )
+
+    @pytest.mark.asyncio
+    async def test_should_fetch_rotated_key_and_honour_max_age(self):
+        old_pem, old_jwk = generate_signing_key("old")
+        new_pem, new_jwk = generate_signing_key("new")
+        requests = []
+
+        def handler(request: httpx.Request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={"keys": [old_jwk, new_jwk]},
+                headers={"Cache-Control": "public, max-age=120", "Age": "20"},
+            )
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            cache = JWKSCache(
+                "Test",
+                "https://keys.invalid/certs",
+                issuers=[ISSUER],
+                min_refresh_interval=0,
+                client=client,
+            )
+            cache.seed({"keys": [old_jwk]}, max_age=3600)
+
+            claims = await cache.verify(sign(new_pem, "new"), audience=AUDIENCE)
+            await cache.verify(sign(new_pem, "new"), audience=AUDIENCE)
+            await cache.close()
+
+        assert claims["sub"] == "1234567890"
+        assert len(requests) == 1
+        assert 0 < cache.stats()["expires_in"] <= 100
+
+    @pytest.mark.asyncio
+    async def test_should_not_refetch_unknown_key_within_min_interval(self):
+        private_pem, public_jwk = generate_signing_key("key-1")
+        cache = JWKSCache(
+            "Test",
+            "https://keys.invalid/certs",
+            issuers=[ISSUER],
+            min_refresh_interval=60,
+        )
+        cache.seed({"keys": [public_jwk]}, max_age=3600)
+
+        with pytest.raises(JWTError):
+            await cache.verify(sign(private_pem, "forged"), audience=AUDIENCE)
+        assert cache.fetches == 0